@@ -1,12 +1,19 @@
 """
 API routes for the Biotech Deal Network.
 """
+import hashlib
 import logging
-from typing import List, Optional
-from fastapi import APIRouter, HTTPException, Query
-from pydantic import BaseModel
-
-from ..services.graph_service import get_graph_service
+from typing import List, Optional, Tuple
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Request, Response
+import orjson
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import BaseModel, ConfigDict
+
+from ..services.cache import get_response_cache
+from ..services.ingest_jobs import get_ingest_job_registry
+from ..services.graph_service import GraphService, get_graph_service
+# Imported eagerly so the admin route doesn't pay the import-system cost on first hit
+from ..services.neo4j_service import get_neo4j_service
 from ..config import settings
 
 logger = logging.getLogger(__name__)
@@ -14,9 +21,58 @@ logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
+def graph_service_dep(request: Request) -> GraphService:
+    """
+    Resolve the GraphService instantiated at startup (app.state), falling back
+    to the module singleton when the lifespan hasn't run (e.g. in tests).
+    """
+    service = getattr(request.app.state, "graph_service", None)
+    return service if service is not None else get_graph_service()
+
+# Handlers that touch the database are plain `def`: FastAPI runs them in its
+# threadpool, so a slow SQLite/Neo4j call blocks one worker thread instead of
+# the event loop, and concurrent requests overlap their DB waits. Handlers
+# that only touch in-process state stay async.
+
+# Responses for these read-heavy endpoints change on the order of minutes-to-hours,
+# so repeat calls are served from the in-process cache instead of hitting the DB.
+CACHE_TTL_SECONDS = 3600.0
+HEALTH_CACHE_TTL_SECONDS = 10.0
+
+
+def _etag_for(content) -> str:
+    """Content hash used as an ETag for conditional GETs."""
+    return hashlib.blake2b(orjson.dumps(content), digest_size=16).hexdigest()
+
+
+def _parse_filter(values: Optional[List[str]], known: frozenset) -> Optional[Tuple[str, ...]]:
+    """
+    Parse filter query params, accepting both repeated (?p=A&p=B) and
+    comma-separated (?p=A,B) forms. Values the data model can never contain
+    are rejected with a 422 so a typo fails loudly instead of silently
+    returning an unfiltered graph. Values are deduplicated and sorted so
+    semantically-equal filter sets produce identical cache keys regardless
+    of query-string order.
+    """
+    if not values:
+        return None
+    flat = {v for raw in values for v in raw.split(",") if v}
+    unknown = sorted(flat - known)
+    if unknown:
+        raise HTTPException(
+            status_code=422,
+            detail=f"Unknown filter value(s): {', '.join(unknown)}. "
+                   f"Expected one of: {', '.join(sorted(known))}"
+        )
+    return tuple(sorted(flat)) or None
+
+
 # ==================== Request/Response Models ====================
 
 class HealthResponse(BaseModel):
+    # Frozen: instances are shared via the response cache
+    model_config = ConfigDict(frozen=True)
+
     status: str
     database: str
     stats: dict
@@ -26,12 +82,14 @@ class IngestRequest(BaseModel):
     indication_terms: Optional[List[str]] = None
     indication: str = "MuM"
     max_trials: Optional[int] = None
+    background: bool = False  # If true, run ingestion as a background job and poll /ingest/status
 
 
 class IngestResponse(BaseModel):
     status: str
     indication: str
     stats: dict
+    job_id: Optional[str] = None
 
 
 class SearchResult(BaseModel):
@@ -46,6 +104,9 @@ class GraphResponse(BaseModel):
 
 
 class LandscapeResponse(BaseModel):
+    # Frozen: instances are shared via the response cache
+    model_config = ConfigDict(frozen=True)
+
     indication: str
     assets_by_phase: List[dict]
     sponsors_by_trial_count: List[dict]
@@ -71,23 +132,37 @@ class CompanyCreateRequest(BaseModel):
 
 # ==================== Endpoints ====================
 
+@router.get("/health/liveness")
+async def liveness_check():
+    """
+    Liveness probe: static response, no database touch.
+    Point orchestrator liveness here; use /health for readiness.
+    """
+    return {"status": "alive"}
+
+
 @router.get("/health", response_model=HealthResponse)
-async def health_check():
+def health_check(graph_service: GraphService = Depends(graph_service_dep)):
     """
     Health check endpoint.
     Returns database status and basic stats.
     """
+    cache = get_response_cache()
+    cached = cache.get(("health",))
+    if cached is not None:
+        return cached
     try:
-        graph_service = get_graph_service()
         stats = graph_service.get_stats()
-        
-        return HealthResponse(
+
+        response = HealthResponse(
             status="healthy",
             database="connected",
             stats=stats
         )
+        cache.set(("health",), response, ttl=HEALTH_CACHE_TTL_SECONDS)
+        return response
     except Exception as e:
-        logger.error(f"Health check failed: {e}")
+        logger.error("Health check failed: %s", e)
         return HealthResponse(
             status="unhealthy",
             database=f"error: {str(e)}",
@@ -95,147 +170,216 @@ async def health_check():
         )
 
 
+def _run_ingest_job(job_id: str, graph_service: GraphService, indication: str, max_trials: Optional[int]):
+    """Execute an ingestion run for a background job, recording progress in the registry."""
+    registry = get_ingest_job_registry()
+    registry.mark_running(job_id)
+    try:
+        stats = graph_service.ingest_indication(indication=indication, max_trials=max_trials)
+        get_response_cache().clear()
+        registry.mark_completed(job_id, stats)
+    except Exception as e:
+        logger.error("Background ingestion %s failed: %s", job_id, e)
+        registry.mark_failed(job_id, str(e))
+
+
 @router.post("/ingest/clinicaltrials", response_model=IngestResponse)
-async def ingest_clinical_trials(request: IngestRequest):
+def ingest_clinical_trials(
+    request: IngestRequest,
+    background_tasks: BackgroundTasks,
+    graph_service: GraphService = Depends(graph_service_dep)
+):
     """
     Ingest clinical trials for an indication.
-    
+
     This endpoint:
     1. Fetches trials from ClinicalTrials.gov for the given indication
     2. Extracts companies (sponsors) and assets (interventions)
     3. Creates nodes and relationships in the graph
+
+    With background=true the run is queued instead of blocking the request;
+    poll /ingest/status/{job_id} for progress.
     """
-    try:
-        graph_service = get_graph_service()
-        
-        # Ensure schema is initialized
-        graph_service.init_database()
-        
-        # Run ingestion
-        stats = graph_service.ingest_indication(
-            indication=request.indication,
-            max_trials=request.max_trials
+    # Ensure schema is initialized
+    graph_service.init_database()
+
+    if request.background:
+        job_id = get_ingest_job_registry().create(request.indication)
+        background_tasks.add_task(
+            _run_ingest_job, job_id, graph_service,
+            request.indication, request.max_trials
         )
-        
         return IngestResponse(
-            status="completed",
+            status="queued",
             indication=request.indication,
-            stats=stats
+            stats={},
+            job_id=job_id
         )
-    except Exception as e:
-        logger.error(f"Ingestion failed: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+
+    # Run ingestion
+    stats = graph_service.ingest_indication(
+        indication=request.indication,
+        max_trials=request.max_trials
+    )
+
+    # Ingestion mutates the graph - drop cached responses so reads aren't stale
+    get_response_cache().clear()
+
+    return IngestResponse(
+        status="completed",
+        indication=request.indication,
+        stats=stats
+    )
+
+
+@router.get("/ingest/status/{job_id}")
+async def get_ingest_status(job_id: str):
+    """
+    Get the status of a background ingestion job.
+    """
+    job = get_ingest_job_registry().get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Ingest job not found")
+    return job
 
 
 @router.get("/search", response_model=SearchResult)
-async def search(
+def search(
     q: str = Query(..., description="Search query"),
-    limit: int = Query(20, le=100, description="Maximum results per type")
+    limit: int = Query(20, le=100, description="Maximum results per type"),
+    graph_service: GraphService = Depends(graph_service_dep)
 ):
     """
     Search across companies, assets, and trials.
     """
-    try:
-        graph_service = get_graph_service()
-        results = graph_service.search(q, limit)
-        
-        return SearchResult(
-            companies=results.get("companies", []),
-            assets=results.get("assets", []),
-            trials=results.get("trials", [])
-        )
-    except Exception as e:
-        logger.error(f"Search failed: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    results = graph_service.search(q, limit)
+
+    return SearchResult(
+        companies=results.get("companies", []),
+        assets=results.get("assets", []),
+        trials=results.get("trials", [])
+    )
 
 
 @router.get("/graph/indication", response_model=GraphResponse)
-async def get_indication_graph(
+def get_indication_graph(
     name: str = Query(..., description="Indication code (e.g., MuM)"),
     depth: int = Query(2, ge=1, le=10, description="Graph traversal depth"),
-    phases: Optional[str] = Query(None, description="Comma-separated phase filters"),
-    modalities: Optional[str] = Query(None, description="Comma-separated modality filters"),
+    phases: Optional[List[str]] = Query(None, description="Phase filters (repeatable or comma-separated)"),
+    modalities: Optional[List[str]] = Query(None, description="Modality filters (repeatable or comma-separated)"),
     include_trials: bool = Query(False, description="Include trial nodes (legacy)"),
-    trial_filter: Optional[str] = Query("none", description="Which trials to show: none, recruiting, active_not_recruiting, all")
+    trial_filter: Optional[str] = Query("none", description="Which trials to show: none, recruiting, active_not_recruiting, all"),
+    graph_service: GraphService = Depends(graph_service_dep)
 ):
     """
     Get the network graph for an indication.
-    
+
     Returns nodes and edges for visualization.
     trial_filter: none (no trial nodes), recruiting, active_not_recruiting, all.
     """
-    try:
-        graph_service = get_graph_service()
-        
-        # Parse filters
-        phase_filter = phases.split(",") if phases else None
-        modality_filter = modalities.split(",") if modalities else None
-        
-        result = graph_service.get_indication_network(
-            indication=name,
-            depth=depth,
-            phase_filter=phase_filter,
-            modality_filter=modality_filter,
-            include_trials=include_trials,
-            trial_filter=trial_filter
-        )
-        
-        return GraphResponse(
-            nodes=result.get("nodes", []),
-            edges=result.get("edges", [])
-        )
-    except Exception as e:
-        logger.error(f"Graph query failed: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    phase_filter = _parse_filter(phases, settings.known_phases)
+    modality_filter = _parse_filter(modalities, settings.known_modalities)
+
+    cache = get_response_cache()
+    cache_key = ("graph_indication", name, depth, phase_filter, modality_filter, include_trials, trial_filter)
+    cached = cache.get(cache_key)
+    if cached is not None:
+        return ORJSONResponse(content=cached)
+
+    result = graph_service.get_indication_network(
+        indication=name,
+        depth=depth,
+        phase_filter=phase_filter,
+        modality_filter=modality_filter,
+        include_trials=include_trials,
+        trial_filter=trial_filter
+    )
+
+    # Serialize the DB-layer dicts directly; re-validating thousands of
+    # node/edge dicts through GraphResponse is pure overhead on this path.
+    content = {
+        "nodes": result.get("nodes", []),
+        "edges": result.get("edges", [])
+    }
+    cache.set(cache_key, content, ttl=CACHE_TTL_SECONDS)
+    return ORJSONResponse(content=content)
+
+
+@router.get("/graph/indication/stream")
+def stream_indication_graph(
+    name: str = Query(..., description="Indication code (e.g., MuM)"),
+    depth: int = Query(2, ge=1, le=10, description="Graph traversal depth"),
+    phases: Optional[List[str]] = Query(None, description="Phase filters (repeatable or comma-separated)"),
+    modalities: Optional[List[str]] = Query(None, description="Modality filters (repeatable or comma-separated)"),
+    include_trials: bool = Query(False, description="Include trial nodes (legacy)"),
+    trial_filter: Optional[str] = Query("none", description="Which trials to show: none, recruiting, active_not_recruiting, all"),
+    graph_service: GraphService = Depends(graph_service_dep)
+):
+    """
+    Stream the indication graph as NDJSON, one node/edge per line.
+
+    For large graphs this avoids buffering the whole serialized body in
+    memory and lets clients start parsing before the last row is written.
+    The buffered /graph/indication endpoint remains for small clients.
+    """
+    phase_filter = _parse_filter(phases, settings.known_phases)
+    modality_filter = _parse_filter(modalities, settings.known_modalities)
+
+    result = graph_service.get_indication_network(
+        indication=name,
+        depth=depth,
+        phase_filter=phase_filter,
+        modality_filter=modality_filter,
+        include_trials=include_trials,
+        trial_filter=trial_filter
+    )
+
+    def generate():
+        for node in result.get("nodes", []):
+            yield orjson.dumps({"type": "node", **node}) + b"\n"
+        for edge in result.get("edges", []):
+            yield orjson.dumps({"type": "edge", **edge}) + b"\n"
+
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
 
 
 @router.get("/company/{company_id}")
-async def get_company(company_id: str):
+def get_company(company_id: str, graph_service: GraphService = Depends(graph_service_dep)):
     """
     Get detailed information about a company.
     
     Returns company data with related assets, trials, and deals.
     """
-    try:
-        graph_service = get_graph_service()
-        result = graph_service.get_company_details(company_id)
-        
-        if not result:
-            raise HTTPException(status_code=404, detail="Company not found")
-        
-        return result
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Company query failed: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    result = graph_service.get_company_details(company_id)
+
+    if not result:
+        raise HTTPException(status_code=404, detail="Company not found")
+
+    return result
 
 
 @router.get("/asset/{asset_id}")
-async def get_asset(asset_id: str):
+def get_asset(asset_id: str, graph_service: GraphService = Depends(graph_service_dep)):
     """
     Get detailed information about an asset.
     
     Returns asset data with related trials, owners, and deals.
     Includes user-confirmed overrides (modality, targets, ownership).
     """
-    try:
-        graph_service = get_graph_service()
-        result = graph_service.get_asset_details(asset_id)
-        
-        if not result:
-            raise HTTPException(status_code=404, detail="Asset not found")
-        
-        return result
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Asset query failed: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    result = graph_service.get_asset_details(asset_id)
+
+    if not result:
+        raise HTTPException(status_code=404, detail="Asset not found")
+
+    return result
 
 
 @router.patch("/asset/{asset_id}")
-async def update_asset(asset_id: str, body: AssetUpdateRequest):
+def update_asset(
+    asset_id: str,
+    body: AssetUpdateRequest,
+    graph_service: GraphService = Depends(graph_service_dep)
+):
     """
     Update asset with user-confirmed data. ClinicalTrials.gov ingestion will not overwrite these.
     
@@ -245,116 +389,123 @@ async def update_asset(asset_id: str, body: AssetUpdateRequest):
     - owner_company_name: set/confirm owner by name (creates company if new)
     - relationship_type: owns, licenses, or uses_as_comparator
     """
-    try:
-        graph_service = get_graph_service()
-        # If owner by name, create or get company first
-        owner_company_id = body.owner_company_id
-        if body.owner_company_name and body.owner_company_name.strip():
-            owner_company_id = graph_service.create_company(body.owner_company_name.strip())
-        result = graph_service.update_asset(
-            asset_id,
-            modality=body.modality,
-            targets=body.targets,
-            owner_company_id=owner_company_id,
-            relationship_type=body.relationship_type,
-        )
-        if not result:
-            raise HTTPException(status_code=404, detail="Asset not found or update not supported")
-        return result
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Asset update failed: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    # If owner by name, create or get company first
+    owner_company_id = body.owner_company_id
+    if body.owner_company_name and body.owner_company_name.strip():
+        owner_company_id = graph_service.create_company(body.owner_company_name.strip())
+    result = graph_service.update_asset(
+        asset_id,
+        modality=body.modality,
+        targets=body.targets,
+        owner_company_id=owner_company_id,
+        relationship_type=body.relationship_type,
+    )
+    if not result:
+        raise HTTPException(status_code=404, detail="Asset not found or update not supported")
+    return result
 
 
 @router.post("/company")
-async def create_company(body: CompanyCreateRequest):
+def create_company(
+    body: CompanyCreateRequest,
+    graph_service: GraphService = Depends(graph_service_dep)
+):
     """
     Create a company (sponsor) by name. Use when assigning an asset to a new sponsor.
     Returns company_id. Idempotent: same name returns same company_id.
     """
-    try:
-        graph_service = get_graph_service()
-        company_id = graph_service.create_company(body.name)
-        return {"company_id": company_id, "name": body.name.strip()}
-    except Exception as e:
-        logger.error(f"Create company failed: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    company_id = graph_service.create_company(body.name)
+    return {"company_id": company_id, "name": body.name.strip()}
 
 
 @router.get("/trial/{trial_id}")
-async def get_trial(trial_id: str):
+def get_trial(trial_id: str, graph_service: GraphService = Depends(graph_service_dep)):
     """
     Get detailed information about a clinical trial.
     """
-    try:
-        graph_service = get_graph_service()
-        result = graph_service.get_trial_details(trial_id)
-        
-        if not result:
-            raise HTTPException(status_code=404, detail="Trial not found")
-        
-        return result
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Trial query failed: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    result = graph_service.get_trial_details(trial_id)
+
+    if not result:
+        raise HTTPException(status_code=404, detail="Trial not found")
+
+    return result
 
 
 @router.get("/landscape", response_model=LandscapeResponse)
-async def get_landscape(
-    indication: str = Query("MuM", description="Indication code")
+def get_landscape(
+    request: Request,
+    response: Response,
+    indication: str = Query("MuM", description="Indication code"),
+    graph_service: GraphService = Depends(graph_service_dep)
 ):
     """
     Get landscape summary for an indication.
-    
+
     Returns statistics about assets, sponsors, modalities, and targets,
     plus a standard of care summary (if available).
+    Supports conditional GET: matching If-None-Match returns 304 with no body.
     """
-    try:
-        graph_service = get_graph_service()
-        result = graph_service.get_landscape(indication)
-        
-        return LandscapeResponse(
-            indication=indication,
-            assets_by_phase=result.get("assets_by_phase", []),
-            sponsors_by_trial_count=result.get("sponsors_by_trial_count", []),
-            modalities=result.get("modalities", []),
-            targets=result.get("targets", []),
-            total_trials=result.get("total_trials", 0),
-            total_assets=result.get("total_assets", 0),
-            total_companies=result.get("total_companies", 0),
-            standard_of_care=result.get("standard_of_care", {})
-        )
-    except Exception as e:
-        logger.error(f"Landscape query failed: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    cache = get_response_cache()
+    cache_key = ("landscape", indication)
+    cached = cache.get(cache_key)
+    if cached is not None:
+        etag, body = cached
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers={"ETag": etag})
+        response.headers["ETag"] = etag
+        return body
+
+    result = graph_service.get_landscape(indication)
+
+    body = LandscapeResponse(
+        indication=indication,
+        assets_by_phase=result.get("assets_by_phase", []),
+        sponsors_by_trial_count=result.get("sponsors_by_trial_count", []),
+        modalities=result.get("modalities", []),
+        targets=result.get("targets", []),
+        total_trials=result.get("total_trials", 0),
+        total_assets=result.get("total_assets", 0),
+        total_companies=result.get("total_companies", 0),
+        standard_of_care=result.get("standard_of_care", {})
+    )
+    etag = _etag_for(result)
+    cache.set(cache_key, (etag, body), ttl=CACHE_TTL_SECONDS)
+    response.headers["ETag"] = etag
+    return body
 
 
 @router.get("/config/indications")
-async def get_configured_indications():
+async def get_configured_indications(request: Request, response: Response):
     """
     Get list of configured indications and their search terms.
+    Static between deploys, so conditional GETs are served as 304s.
     """
-    return {
-        "default": settings.default_indication,
-        "indications": settings.indication_terms
-    }
+    cache = get_response_cache()
+    cached = cache.get(("config_indications",))
+    if cached is None:
+        body = {
+            "default": settings.default_indication,
+            "indications": settings.indication_terms
+        }
+        cached = (_etag_for(body), body)
+        cache.set(("config_indications",), cached, ttl=CACHE_TTL_SECONDS)
+    etag, body = cached
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    return body
 
 
 @router.post("/admin/clear")
-async def clear_database():
+def clear_database():
     """
     Clear all data from the database (admin/dev use only).
     """
-    try:
-        from ..services.neo4j_service import get_neo4j_service
-        neo4j = get_neo4j_service()
-        neo4j.clear_database()
-        
-        return {"status": "cleared"}
-    except Exception as e:
-        logger.error(f"Clear database failed: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    neo4j = get_neo4j_service()
+    neo4j.clear_database()
+
+    # Clearing mutates the graph - drop cached responses so reads aren't stale
+    get_response_cache().clear()
+    get_graph_service().invalidate_caches()
+
+    return {"status": "cleared"}
@@ -2,22 +2,30 @@
 Configuration for the Biotech Deal Network backend.
 All settings can be overridden via environment variables.
 """
-import os
-from typing import List
-from pydantic_settings import BaseSettings
+from functools import lru_cache
+from typing import FrozenSet, Tuple
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class Settings(BaseSettings):
     """Application settings with environment variable support."""
-    
+
+    # Frozen so pydantic skips change-tracking; env vars map to field names
+    # case-insensitively (DEBUG -> debug, NEO4J_URI -> neo4j_uri, ...)
+    model_config = SettingsConfigDict(env_file=".env", extra="allow", frozen=True)
+
     # Application
     app_name: str = "Biotech Deal Network"
-    debug: bool = os.getenv("DEBUG", "false").lower() == "true"
-    
+    debug: bool = False
+
     # Neo4j
-    neo4j_uri: str = os.getenv("NEO4J_URI", "bolt://neo4j:7687")
-    neo4j_user: str = os.getenv("NEO4J_USER", "neo4j")
-    neo4j_password: str = os.getenv("NEO4J_PASSWORD", "biotech123")
+    neo4j_uri: str = "bolt://neo4j:7687"
+    neo4j_user: str = "neo4j"
+    neo4j_password: str = "biotech123"
+    # Driver connection pool tuning (concurrent /graph requests each hold a connection)
+    neo4j_max_pool_size: int = 50
+    neo4j_acquire_timeout: float = 60.0
+    neo4j_max_lifetime: int = 3600
     
     # ClinicalTrials.gov API
     clinicaltrials_api_base: str = "https://clinicaltrials.gov/api/v2"
@@ -26,9 +34,9 @@ class Settings(BaseSettings):
     
     # Indication seed configuration
     # Default: Mucosal Melanoma (MuM)
-    default_indication: str = os.getenv("DEFAULT_INDICATION", "MuM")
+    default_indication: str = "MuM"
     indication_terms: dict = {
-        "MuM": [
+        "MuM": (
             "mucosal melanoma",
             "mucosal malignant melanoma",
             "melanoma of mucosa",
@@ -36,24 +44,41 @@ class Settings(BaseSettings):
             "melanoma, uveal",  # ClinicalTrials.gov variant (e.g. NCT05315258)
             "metastatic uveal melanoma",
             "ocular melanoma"
-        ],
+        ),
         # Add more indications as needed
     }
     
+    # Valid graph filter values - query params outside these sets are dropped
+    # before they reach the storage layer (phases are CT.gov enum values,
+    # modalities are what the normalization service can assign)
+    known_phases: FrozenSet[str] = frozenset({
+        "EARLY_PHASE1", "PHASE1", "PHASE2", "PHASE3", "PHASE4", "NA"
+    })
+    # Must cover every value the normalization service can assign AND every
+    # entry a user can pick in the frontend (MODALITY_OPTIONS in
+    # DetailDrawer.tsx) - keep the two lists in sync.
+    known_modalities: FrozenSet[str] = frozenset({
+        "antibody", "small_molecule", "cell_therapy", "vaccine", "bispecific",
+        "adc", "gene_therapy", "oncolytic_virus", "checkpoint_inhibitor",
+        "chemotherapy", "peptide", "protein", "radiation", "other"
+    })
+
     # LLM enrichment (optional)
-    llm_enrichment_enabled: bool = os.getenv("LLM_ENRICHMENT_ENABLED", "false").lower() == "true"
-    openai_api_key: str = os.getenv("OPENAI_API_KEY", "")
-    
+    llm_enrichment_enabled: bool = False
+    openai_api_key: str = ""
+
     # Data quality
     min_confidence_threshold: float = 0.5
-    
-    class Config:
-        env_file = ".env"
-        extra = "allow"
-    
-    def get_indication_terms(self, indication: str) -> List[str]:
-        """Get search terms for an indication."""
-        return self.indication_terms.get(indication, [indication])
+
+    def get_indication_terms(self, indication: str) -> Tuple[str, ...]:
+        """Get search terms for an indication (memoized; called per ingestion/query)."""
+        return _indication_terms_cached(indication)
+
+
+@lru_cache(maxsize=64)
+def _indication_terms_cached(indication: str) -> Tuple[str, ...]:
+    """Resolve an indication code to its search-term tuple once, then serve from cache."""
+    return tuple(settings.indication_terms.get(indication, (indication,)))
 
 
 settings = Settings()
@@ -3,7 +3,8 @@ Deal sources module - pluggable sources for deal ingestion.
 Currently contains stubs for future implementation.
 """
 from .base import DealSource
+from .http_client import get_shared_client, close_shared_client
 from .sec_edgar import SECEdgarSource
 from .press_releases import PressReleaseSource
 
-__all__ = ["DealSource", "SECEdgarSource", "PressReleaseSource"]
+__all__ = ["DealSource", "SECEdgarSource", "PressReleaseSource", "get_shared_client", "close_shared_client"]
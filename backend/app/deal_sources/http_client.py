@@ -0,0 +1,29 @@
+"""
+Shared HTTP client for deal sources.
+One keep-alive connection pool across feed/filing fetches, so each request
+reuses an open connection instead of paying a fresh TCP+TLS handshake.
+"""
+from typing import Optional
+
+import httpx
+
+_shared_client: Optional[httpx.Client] = None
+
+
+def get_shared_client() -> httpx.Client:
+    """Get or create the pooled HTTP client shared by all deal sources."""
+    global _shared_client
+    if _shared_client is None:
+        _shared_client = httpx.Client(
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+            timeout=30.0
+        )
+    return _shared_client
+
+
+def close_shared_client() -> None:
+    """Close the pooled client (called from app shutdown)."""
+    global _shared_client
+    if _shared_client is not None:
+        _shared_client.close()
+        _shared_client = None
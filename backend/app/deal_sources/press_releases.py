@@ -3,6 +3,7 @@ Press release deal source (STUB).
 Future implementation will monitor RSS feeds for deal announcements.
 """
 import logging
+import re
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 
@@ -56,9 +57,20 @@ class PressReleaseSource(DealSource):
         "milestone payment",
         "upfront payment"
     ]
-    
+
+    # Single compiled alternation so filtering an entry is one scan of the
+    # text instead of one substring search per keyword
+    _DEAL_KEYWORD_RE = re.compile(
+        "|".join(re.escape(k) for k in DEAL_KEYWORDS), re.IGNORECASE
+    )
+
     def __init__(self):
         self.enabled = False  # Disabled by default
+
+    @classmethod
+    def is_deal_related(cls, text: str) -> bool:
+        """Check whether press release text mentions any deal keyword."""
+        return bool(cls._DEAL_KEYWORD_RE.search(text))
     
     @property
     def source_name(self) -> str:
@@ -120,9 +132,11 @@ class PressReleaseSource(DealSource):
         
         # TODO: Implement using feedparser
         # import feedparser
+        # from .http_client import get_shared_client
         # for feed_name, feed_url in self.RSS_FEEDS.items():
-        #     feed = feedparser.parse(feed_url)
+        #     feed = feedparser.parse(get_shared_client().get(feed_url).content)
         #     for entry in feed.entries:
-        #         ...
-        
+        #         if self.is_deal_related(f"{entry.title} {entry.summary}"):
+        #             ...
+
         return []
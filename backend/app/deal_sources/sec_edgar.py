@@ -94,7 +94,10 @@ class SECEdgarSource(DealSource):
             return []
         
         # TODO: Implement
-        # Example API call:
-        # https://data.sec.gov/submissions/CIK{cik}.json
-        
+        # Example API call (use the pooled client so per-CIK fetches reuse
+        # connections, and keep SEC's required User-Agent header):
+        # from .http_client import get_shared_client
+        # get_shared_client().get(f"https://data.sec.gov/submissions/CIK{cik}.json",
+        #                         headers={"User-Agent": "..."})
+
         return []
@@ -6,6 +6,7 @@ import os
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from .api.routes import router
 from .config import settings
@@ -26,8 +27,8 @@ async def lifespan(app: FastAPI):
     """Application lifespan handler."""
     # Startup
     logger.info("Starting Biotech Deal Network API...")
-    logger.info(f"Default indication: {settings.default_indication}")
-    logger.info(f"Database mode: {'SQLite' if USE_SQLITE else 'Neo4j'}")
+    logger.info("Default indication: %s", settings.default_indication)
+    logger.info("Database mode: %s", 'SQLite' if USE_SQLITE else 'Neo4j')
     
     # Initialize database schema
     try:
@@ -41,14 +42,27 @@ async def lifespan(app: FastAPI):
             db.init_schema()
         logger.info("Database schema initialized")
     except Exception as e:
-        logger.error(f"Failed to initialize database: {e}")
-    
+        logger.error("Failed to initialize database: %s", e)
+
+    # Instantiate the graph service once per worker so request handlers get it
+    # via Depends instead of re-resolving the singleton on every call
+    from .services.graph_service import get_graph_service
+    app.state.graph_service = get_graph_service()
+
     yield
     
     # Shutdown
     logger.info("Shutting down Biotech Deal Network API...")
     try:
-        if not USE_SQLITE:
+        from .deal_sources import close_shared_client
+        close_shared_client()
+    except Exception:
+        pass
+    try:
+        if USE_SQLITE:
+            from .services.sqlite_service import get_sqlite_service
+            get_sqlite_service().close()
+        else:
             from .services.neo4j_service import get_neo4j_service
             neo4j = get_neo4j_service()
             neo4j.close()
@@ -61,27 +75,39 @@ app = FastAPI(
     title="Biotech Deal Network API",
     description="Graph-first, asset-aware biotech deal network with clinical trial data.",
     version="0.1.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    # orjson serializes large graph/landscape payloads several times faster than stdlib json
+    default_response_class=ORJSONResponse
 )
 
-# Configure CORS
+# Configure CORS. Explicit methods/headers let the middleware answer
+# preflights from a precomputed set instead of echoing request headers,
+# and max_age lets browsers skip repeat preflights for a day.
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=[
+    allow_origins=(
         "http://localhost:3000",
         "http://localhost:3001",
         "http://127.0.0.1:3000",
         "http://frontend:3000"
-    ],
+    ),
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=("GET", "POST", "PATCH"),
+    allow_headers=("Content-Type", "Authorization"),
+    max_age=86400,
 )
 
 # Include API routes
 app.include_router(router, prefix="/api")
 
 
+@app.exception_handler(Exception)
+async def unhandled_exception_handler(request, exc):
+    """Log and convert any unhandled error to a 500, so routes skip per-handler try/except."""
+    logger.exception("%s failed", request.url.path)
+    return ORJSONResponse({"detail": str(exc)}, status_code=500)
+
+
 @app.get("/")
 async def root():
     """Root endpoint with API information."""
@@ -2,18 +2,36 @@
 Edge models for the property graph.
 These represent relationships between nodes in the biotech deal network.
 """
+import json
+from dataclasses import asdict, dataclass, field
 from datetime import date, datetime
 from typing import Optional, List
 from pydantic import BaseModel, Field
 
+from .nodes import _json_default, _utcnow
 
-class EdgeEvidence(BaseModel):
-    """Evidence/provenance for a relationship."""
+
+@dataclass(slots=True)
+class EdgeEvidence:
+    """
+    Evidence/provenance for a relationship.
+
+    Slotted dataclass like nodes.Evidence: edges are created in bulk during
+    ingestion and the pydantic validation pass added nothing for these
+    internally-built records. model_dump/model_dump_json keep the interface
+    the storage layers use.
+    """
     source_type: str
     source_url: Optional[str] = None
     source_id: Optional[str] = None
     confidence: float = 1.0
-    extracted_at: datetime = Field(default_factory=datetime.utcnow)
+    extracted_at: datetime = field(default_factory=_utcnow)
+
+    def model_dump(self) -> dict:
+        return asdict(self)
+
+    def model_dump_json(self) -> str:
+        return json.dumps(asdict(self), default=_json_default)
 
 
 class PartyTo(BaseModel):
@@ -2,30 +2,244 @@
 Node models for the property graph.
 These represent the core entities in the biotech deal network.
 """
-from datetime import datetime, date
-from typing import List, Optional
-from pydantic import BaseModel, Field
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, date, timezone
+from functools import lru_cache
+from pathlib import Path
+from typing import List, Optional, Tuple, Union
+from pydantic import BaseModel, ConfigDict, Field
 import hashlib
+import json
+import re
 
 
-class Evidence(BaseModel):
-    """Evidence/provenance for a field value."""
+def _short_hash(text: str) -> str:
+    """
+    12-hex-char digest for deterministic entity IDs.
+    MD5 stays because these IDs are persisted in existing databases and must
+    remain stable; usedforsecurity=False skips the FIPS/security checks on
+    interpreters that support it, which is the fast path for non-crypto use.
+    """
+    return hashlib.md5(text.encode(), usedforsecurity=False).hexdigest()[:12]
+
+
+def _compile_patterns(patterns: List[str]) -> "re.Pattern":
+    """Compile a list of literal substrings into one alternation, so a
+    category check is a single C-level scan instead of a Python loop."""
+    return re.compile("|".join(re.escape(p) for p in patterns))
+
+
+def _utcnow() -> datetime:
+    """Timezone-aware replacement for the deprecated datetime.utcnow()."""
+    return datetime.now(timezone.utc)
+
+
+def _json_default(obj):
+    """JSON fallback for datetime/date values in evidence dumps."""
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    raise TypeError(f"Type {type(obj)} not serializable")
+
+
+@dataclass(slots=True)
+class Evidence:
+    """
+    Evidence/provenance for a field value.
+
+    A slotted dataclass rather than a pydantic model: every node carries
+    evidence and they are built in bulk on the trusted ingestion path, where
+    per-construction validation is pure overhead. model_dump/model_dump_json
+    keep the pydantic-style interface the storage layers use.
+    """
     source_type: str  # "clinicaltrials", "sec", "press_release", "inferred"
     source_url: Optional[str] = None
     source_id: Optional[str] = None  # e.g., NCT number
     confidence: float = 1.0
-    extracted_at: datetime = Field(default_factory=datetime.utcnow)
+    extracted_at: datetime = field(default_factory=_utcnow)
     input_fields: Optional[List[str]] = None  # for LLM-inferred fields
 
+    def model_dump(self) -> dict:
+        return asdict(self)
+
+    def model_dump_json(self) -> str:
+        return json.dumps(asdict(self), default=_json_default)
+
+
+# Classifier pattern families for Company.infer_type_from_name, compiled once
+# at import. Category order matters: the first matching family wins.
+_INVESTIGATOR_RE = _compile_patterns([
+    ", md", " md,", " m.d.", ", phd", " ph.d.", ", do,", ", do ",
+    "prof. dr.", "prof dr", ", facs"
+])
+_GOV_RE = _compile_patterns([
+    "national institutes of health", "national cancer institute",
+    "fda", "cdc", "department of defense", "department of health",
+    "ministry of", "veterans affairs", "russian academy"
+])
+_NONPROFIT_RE = _compile_patterns([
+    "eortc", "unicancer", "organisation for research", "organization for research",
+    "alliance for clinical", "cooperative group", "study group",
+    "research network", "research alliance", "partnership",
+    "association nationale", "melanoma research", "cancer research network",
+    "solti", "hoosier", "swog"
+])
+_ACADEMIC_RE = _compile_patterns([
+    "university", "college", "école", "universität", "universidad", "universitaire",
+    "hospital", "medical center", "cancer center", "clinic", "clinique",
+    "institute", "institut", "research center", "academy",
+    "school of medicine", "faculty of", "health network",
+    "comprehensive cancer", "curie", "hospitalier", "hopital",
+    "charite", "chu de", "chu ", "karolinska", "moffitt", "sloan kettering",
+    "dana-farber", "mayo clinic", "fred hutchinson", "northwell",
+    "m.d. anderson", "md anderson", "memorial sloan", "city of hope",
+    "centre jean perrin", "retina research", "foundation"
+])
+_INDUSTRY_RE = _compile_patterns([
+    "inc.", "inc,", " inc", "ltd.", "ltd,", " ltd", "llc", "l.l.c.",
+    "corp.", "corp,", "corporation", "gmbh", " ab", " a/s", " sa", " ag",
+    "pharmaceuticals", "therapeutics", "biosciences", "biopharma",
+    "biotech", "pharma", "oncology", "medicines", "biopharmaceuticals"
+])
+_KNOWN_PHARMA_RE = _compile_patterns([
+    "astrazeneca", "bristol-myers", "bristol myers", "novartis",
+    "servier", "viriom", "roche", "sanofi", "pfizer", "merck",
+    "regeneron", "genentech", "amgen", "gilead", "abbvie"
+])
+# Industry suffixes and known pharma names land in the same branch, so check
+# them in one scan rather than two.
+_ANY_INDUSTRY_RE = re.compile(
+    f"{_INDUSTRY_RE.pattern}|{_KNOWN_PHARMA_RE.pattern}"
+)
+
+
+# ID generation and name classification are pure functions of their string
+# inputs, and ingestion calls them with the same sponsor/intervention names
+# over and over (one sponsor appears across many trials). Memoizing turns the
+# repeat calls into dict hits. Module-level functions because lru_cache
+# doesn't compose cleanly with classmethods.
+
+@lru_cache(maxsize=1 << 15)
+def _lower(name: str) -> str:
+    """Memoized str.lower — the same names are lowered all over ingestion."""
+    return name.lower()
+
+
+@lru_cache(maxsize=1 << 15)
+def _norm(name: str) -> str:
+    """Memoized lowercase-and-strip normalization."""
+    return name.lower().strip()
+
+
+@lru_cache(maxsize=1 << 16)
+def _company_id(name: str) -> str:
+    return f"company_{_short_hash(_norm(name))}"
+
+
+@lru_cache(maxsize=1 << 16)
+def _asset_id(name: str) -> str:
+    return f"asset_{_short_hash(_norm(name))}"
+
+
+@lru_cache(maxsize=1 << 16)
+def _doc_id(url: str) -> str:
+    return f"doc_{_short_hash(url)}"
+
+
+@lru_cache(maxsize=1 << 15)
+def _canonical_parties(parties: Tuple[str, ...]) -> str:
+    """Sorted-and-joined party key, cached per party set — the same parties
+    recur across a deal's status updates and across deal types."""
+    return "-".join(sorted(parties))
+
+
+@lru_cache(maxsize=1 << 16)
+def _deal_id(deal_type: str, parties: Tuple[str, ...], date_str: str) -> str:
+    combined = f"{deal_type}_{_canonical_parties(parties)}_{date_str}".lower()
+    return f"deal_{_short_hash(combined)}"
+
+
+def _sponsor_class_type(sponsor_class: Optional[str]) -> Optional[str]:
+    """Map a ClinicalTrials.gov sponsor class to a company type, or None.
+
+    Checked before any name work: when the sponsor class decides (the
+    majority of CT.gov records), the name is never lowered at all.
+    """
+    if sponsor_class is None:
+        return None
+    sponsor_class_upper = sponsor_class.upper()
+    if sponsor_class_upper == "INDUSTRY":
+        return "industry"
+    if sponsor_class_upper in ("NIH", "FED", "OTHER_GOV"):
+        return "government"
+    return None
+
+
+@lru_cache(maxsize=1 << 16)
+def _infer_company_type(name_lower: str) -> str:
+    """Classify a lowercased company name (see Company.infer_type_from_name)."""
+    # Check for individual investigators (MD, PhD, Dr., Prof.)
+    if _INVESTIGATOR_RE.search(name_lower):
+        return "investigator"
+
+    # Check for government agencies
+    if _GOV_RE.search(name_lower):
+        return "government"
+
+    # Check for consortia and non-profits
+    if _NONPROFIT_RE.search(name_lower):
+        return "nonprofit"
+
+    # Check name patterns for academic/medical institutions
+    if _ACADEMIC_RE.search(name_lower):
+        return "academic"
+
+    # Check for obvious industry patterns, then known pharma companies
+    # without obvious suffixes
+    if _ANY_INDUSTRY_RE.search(name_lower):
+        return "industry"
+
+    # Default to "other" for unclassified
+    return "other"
+
+
+# Phase ordering for Trial.phase_numeric. Built once at import instead of on
+# every property access (sorting a large trial list was allocating this dict
+# per comparison); the memoized lookup also folds away the repeated .lower().
+_PHASE_MAP = {
+    "early phase 1": 0,
+    "phase 1": 1,
+    "phase 1/phase 2": 1,
+    "phase 2": 2,
+    "phase 2/phase 3": 2,
+    "phase 3": 3,
+    "phase 4": 4,
+    "not applicable": -1
+}
+
+
+@lru_cache(maxsize=64)
+def _phase_numeric(phase: str) -> Optional[int]:
+    return _PHASE_MAP.get(phase.lower())
+
 
 class Company(BaseModel):
     """Company node representing a pharma/biotech company or organization."""
+    # Nodes are immutable value objects: frozen skips __setattr__ plumbing,
+    # validate_default skips validating factory defaults, and nested
+    # instances are never re-validated.
+    model_config = ConfigDict(
+        frozen=True, extra="forbid", validate_default=False,
+        revalidate_instances="never"
+    )
+
     company_id: str
     name: str
-    aliases: List[str] = Field(default_factory=list)
+    # Immutable after ingest: tuples are cheaper to validate and store than
+    # lists and make accidental in-place mutation impossible.
+    aliases: Tuple[str, ...] = ()
     country: Optional[str] = None
     public_flag: Optional[bool] = None
-    tickers: List[str] = Field(default_factory=list)
+    tickers: Tuple[str, ...] = ()
     cik: Optional[str] = None  # SEC CIK number
     status: Optional[str] = None  # active, acquired, etc.
     # Organization type: "industry", "academic", "government", "investigator", "other"
@@ -35,102 +249,64 @@ class Company(BaseModel):
     @classmethod
     def generate_id(cls, name: str) -> str:
         """Generate a deterministic ID from company name."""
-        normalized = name.lower().strip()
-        return f"company_{hashlib.md5(normalized.encode()).hexdigest()[:12]}"
-    
+        return _company_id(name)
+
+    @classmethod
+    def build_from_sponsor(
+        cls,
+        name: str,
+        sponsor_class: Optional[str] = None,
+        evidence: Optional[List[Evidence]] = None,
+    ) -> "Company":
+        """
+        Build a Company from a sponsor row in one pass: normalize the name
+        once, then derive both the ID and the company type from it. Trusted
+        path — uses model_construct like unsafe_build.
+        """
+        return cls.model_construct(
+            company_id=f"company_{_short_hash(_norm(name))}",
+            name=name,
+            company_type=(
+                _sponsor_class_type(sponsor_class)
+                or _infer_company_type(_lower(name))
+            ),
+            evidence=evidence if evidence is not None else [],
+        )
+
+    @classmethod
+    def unsafe_build(cls, **kw) -> "Company":
+        """
+        Build without validation for the trusted ingestion path.
+
+        model_construct skips validator dispatch, coercion and error assembly;
+        on pydantic v2 it still applies field defaults. Only use this where
+        the inputs are already shaped by us (CT.gov parsing, SQLite round
+        trips) — the API boundary keeps full validation.
+        """
+        return cls.model_construct(**kw)
+
     @classmethod
     def infer_type_from_name(cls, name: str, sponsor_class: Optional[str] = None) -> str:
         """Infer company type from name and sponsor class."""
-        name_lower = name.lower()
-        
-        # First, check sponsor class from ClinicalTrials.gov (most reliable)
-        if sponsor_class:
-            sponsor_class_upper = sponsor_class.upper()
-            if sponsor_class_upper == "INDUSTRY":
-                return "industry"
-            elif sponsor_class_upper in ("NIH", "FED"):
-                return "government"
-            elif sponsor_class_upper == "OTHER_GOV":
-                return "government"
-        
-        # Check for individual investigators (MD, PhD, Dr., Prof.)
-        investigator_patterns = [
-            ", md", " md,", " m.d.", ", phd", " ph.d.", ", do,", ", do ",
-            "prof. dr.", "prof dr", ", facs"
-        ]
-        if any(pattern in name_lower for pattern in investigator_patterns):
-            return "investigator"
-        
-        # Check for government agencies
-        gov_patterns = [
-            "national institutes of health", "national cancer institute",
-            "fda", "cdc", "department of defense", "department of health",
-            "ministry of", "veterans affairs", "russian academy"
-        ]
-        if any(pattern in name_lower for pattern in gov_patterns):
-            return "government"
-        
-        # Check for consortia and non-profits
-        nonprofit_patterns = [
-            "eortc", "unicancer", "organisation for research", "organization for research",
-            "alliance for clinical", "cooperative group", "study group",
-            "research network", "research alliance", "partnership",
-            "association nationale", "melanoma research", "cancer research network",
-            "solti", "hoosier", "swog"
-        ]
-        if any(pattern in name_lower for pattern in nonprofit_patterns):
-            return "nonprofit"
-        
-        # Check name patterns for academic/medical institutions
-        academic_patterns = [
-            "university", "college", "école", "universität", "universidad", "universitaire",
-            "hospital", "medical center", "cancer center", "clinic", "clinique",
-            "institute", "institut", "research center", "academy",
-            "school of medicine", "faculty of", "health network",
-            "comprehensive cancer", "curie", "hospitalier", "hopital",
-            "charite", "chu de", "chu ", "karolinska", "moffitt", "sloan kettering",
-            "dana-farber", "mayo clinic", "fred hutchinson", "northwell",
-            "m.d. anderson", "md anderson", "memorial sloan", "city of hope",
-            "centre jean perrin", "retina research", "foundation"
-        ]
-        if any(pattern in name_lower for pattern in academic_patterns):
-            return "academic"
-        
-        # Check for obvious industry patterns
-        industry_patterns = [
-            "inc.", "inc,", " inc", "ltd.", "ltd,", " ltd", "llc", "l.l.c.",
-            "corp.", "corp,", "corporation", "gmbh", " ab", " a/s", " sa", " ag",
-            "pharmaceuticals", "therapeutics", "biosciences", "biopharma", 
-            "biotech", "pharma", "oncology", "medicines", "biopharmaceuticals"
-        ]
-        if any(pattern in name_lower for pattern in industry_patterns):
-            return "industry"
-        
-        # Known pharma companies without obvious suffixes
-        known_pharma = [
-            "astrazeneca", "bristol-myers", "bristol myers", "novartis", 
-            "servier", "viriom", "roche", "sanofi", "pfizer", "merck",
-            "regeneron", "genentech", "amgen", "gilead", "abbvie"
-        ]
-        if any(pattern in name_lower for pattern in known_pharma):
-            return "industry"
-        
-        # If sponsor_class was INDUSTRY, trust it
-        if sponsor_class and sponsor_class.upper() == "INDUSTRY":
-            return "industry"
-        
-        # Default to "other" for unclassified
-        return "other"
+        return (
+            _sponsor_class_type(sponsor_class)
+            or _infer_company_type(_lower(name))
+        )
 
 
 class Asset(BaseModel):
     """Asset node representing a drug/therapeutic asset."""
+    model_config = ConfigDict(
+        frozen=True, extra="forbid", validate_default=False,
+        revalidate_instances="never"
+    )
+
     asset_id: str
     name: str
-    synonyms: List[str] = Field(default_factory=list)
+    synonyms: Tuple[str, ...] = ()
     modality: Optional[str] = None  # small molecule, antibody, cell therapy, etc.
-    targets: List[str] = Field(default_factory=list)
-    indications: List[str] = Field(default_factory=list)
+    targets: Tuple[str, ...] = ()
+    indications: Tuple[str, ...] = ()
     stage_current: Optional[str] = None  # preclinical, phase1, phase2, phase3, approved
     evidence: List[Evidence] = Field(default_factory=list)
     
@@ -141,12 +317,21 @@ class Asset(BaseModel):
     @classmethod
     def generate_id(cls, name: str) -> str:
         """Generate a deterministic ID from asset name."""
-        normalized = name.lower().strip()
-        return f"asset_{hashlib.md5(normalized.encode()).hexdigest()[:12]}"
+        return _asset_id(name)
+
+    @classmethod
+    def unsafe_build(cls, **kw) -> "Asset":
+        """Build without validation; see Company.unsafe_build."""
+        return cls.model_construct(**kw)
 
 
 class Deal(BaseModel):
     """Deal node representing a business transaction."""
+    model_config = ConfigDict(
+        frozen=True, extra="forbid", validate_default=False,
+        revalidate_instances="never"
+    )
+
     deal_id: str
     deal_type: str  # license, acquisition, collaboration, etc.
     announce_date: Optional[date] = None
@@ -158,44 +343,69 @@ class Deal(BaseModel):
     @classmethod
     def generate_id(cls, deal_type: str, parties: List[str], date_str: str = "") -> str:
         """Generate a deterministic ID from deal info."""
-        combined = f"{deal_type}_{'-'.join(sorted(parties))}_{date_str}".lower()
-        return f"deal_{hashlib.md5(combined.encode()).hexdigest()[:12]}"
+        return _deal_id(deal_type, tuple(parties), date_str)
 
 
 class Document(BaseModel):
     """Document node representing a source document."""
+    model_config = ConfigDict(
+        frozen=True, extra="forbid", validate_default=False,
+        revalidate_instances="never"
+    )
+
     doc_id: str
     doc_type: str  # clinical_trial, sec_filing, press_release, guideline
     publisher: Optional[str] = None
     url: str
     published_at: Optional[datetime] = None
-    retrieved_at: datetime = Field(default_factory=datetime.utcnow)
+    retrieved_at: datetime = Field(default_factory=_utcnow)
     text_hash: Optional[str] = None
     raw_content: Optional[str] = None  # Store raw JSON/text for provenance
     
     @classmethod
     def generate_id(cls, url: str) -> str:
         """Generate a deterministic ID from URL."""
-        return f"doc_{hashlib.md5(url.encode()).hexdigest()[:12]}"
+        return _doc_id(url)
     
     @classmethod
-    def compute_hash(cls, content: str) -> str:
-        """Compute hash of document content."""
-        return hashlib.sha256(content.encode()).hexdigest()
+    def compute_hash(cls, content: Union[str, bytes, Path]) -> str:
+        """
+        Compute hash of document content.
+
+        Accepts bytes (hashed as-is, no re-encode) and paths (streamed via
+        hashlib.file_digest, so a large filing is never loaded whole) in
+        addition to str; the encode-then-hash copy only happens for str.
+        """
+        if isinstance(content, Path):
+            with open(content, "rb") as f:
+                return hashlib.file_digest(f, "sha256").hexdigest()
+        if isinstance(content, str):
+            content = content.encode()
+        return hashlib.sha256(content).hexdigest()
+
+    @classmethod
+    def unsafe_build(cls, **kw) -> "Document":
+        """Build without validation; see Company.unsafe_build."""
+        return cls.model_construct(**kw)
 
 
 class Trial(BaseModel):
     """Trial node representing a clinical trial."""
+    model_config = ConfigDict(
+        frozen=True, extra="forbid", validate_default=False,
+        revalidate_instances="never"
+    )
+
     trial_id: str  # NCT number
     title: str
     phase: Optional[str] = None
     status: Optional[str] = None  # recruiting, completed, terminated, etc.
     start_date: Optional[date] = None
     completion_date: Optional[date] = None
-    interventions: List[str] = Field(default_factory=list)
-    conditions: List[str] = Field(default_factory=list)
-    sponsors: List[str] = Field(default_factory=list)
-    collaborators: List[str] = Field(default_factory=list)
+    interventions: Tuple[str, ...] = ()
+    conditions: Tuple[str, ...] = ()
+    sponsors: Tuple[str, ...] = ()
+    collaborators: Tuple[str, ...] = ()
     enrollment: Optional[int] = None
     study_type: Optional[str] = None
     brief_summary: Optional[str] = None
@@ -203,20 +413,16 @@ class Trial(BaseModel):
     
     # Direct link to source
     source_url: str = ""
-    
+
+    @classmethod
+    def unsafe_build(cls, **kw) -> "Trial":
+        """Build without validation; see Company.unsafe_build. Dates must
+        already be date objects — model_construct will not coerce strings."""
+        return cls.model_construct(**kw)
+
     @property
     def phase_numeric(self) -> Optional[int]:
         """Convert phase to numeric for sorting."""
-        phase_map = {
-            "early phase 1": 0,
-            "phase 1": 1,
-            "phase 1/phase 2": 1,
-            "phase 2": 2,
-            "phase 2/phase 3": 2,
-            "phase 3": 3,
-            "phase 4": 4,
-            "not applicable": -1
-        }
         if self.phase:
-            return phase_map.get(self.phase.lower(), None)
+            return _phase_numeric(self.phase)
         return None
@@ -0,0 +1,57 @@
+"""
+In-process TTL cache for read-heavy API responses.
+Collapses repeat reads of slowly-changing data (landscape, graph, config)
+to a dictionary lookup instead of a database round-trip.
+"""
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+
+class TTLCache:
+    """Simple thread-safe cache with per-entry time-to-live."""
+
+    def __init__(self, default_ttl: float = 3600.0):
+        self.default_ttl = default_ttl
+        self._entries: Dict[Any, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Any) -> Optional[Any]:
+        """Return the cached value for key, or None if missing/expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if time.monotonic() >= expires_at:
+                del self._entries[key]
+                return None
+            return value
+
+    def set(self, key: Any, value: Any, ttl: Optional[float] = None) -> None:
+        """Store value under key for ttl seconds (default_ttl if not given)."""
+        expires_at = time.monotonic() + (ttl if ttl is not None else self.default_ttl)
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+
+    def pop(self, key: Any) -> None:
+        """Drop a single entry if present (targeted invalidation on writes)."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop all cached entries (call after mutations so reads don't go stale)."""
+        with self._lock:
+            self._entries.clear()
+
+
+# Singleton instance
+_response_cache: Optional[TTLCache] = None
+
+
+def get_response_cache() -> TTLCache:
+    """Get or create the shared response cache singleton."""
+    global _response_cache
+    if _response_cache is None:
+        _response_cache = TTLCache()
+    return _response_cache
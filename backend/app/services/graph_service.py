@@ -3,20 +3,42 @@ Graph service for high-level graph operations and queries.
 """
 import logging
 import os
+from functools import cached_property, lru_cache
+from pathlib import Path
 from typing import Dict, Any, Optional, List
 
+import orjson
+
 from .clinicaltrials_service import get_clinicaltrials_service
 from .normalization_service import get_normalization_service
 from ..config import settings
 
 logger = logging.getLogger(__name__)
 
+# Placeholder SoC info for known indications lives in a data file, marked as
+# needing verified sources; the copy can be updated without a code deploy and
+# workers that never serve a landscape request never parse it.
+_SOC_PATH = Path(__file__).parent.parent.parent / "data" / "soc_placeholders.json"
+
+
+@lru_cache(maxsize=1)
+def _load_soc() -> Dict[str, Dict[str, Any]]:
+    """Load the SoC placeholder data once; treated as read-only after."""
+    try:
+        return orjson.loads(_SOC_PATH.read_bytes())
+    except (OSError, orjson.JSONDecodeError) as e:
+        logger.warning("Could not load SoC placeholders from %s: %s", _SOC_PATH, e)
+        return {}
+
+
+# Backend selection is fixed for the process lifetime; read the env once at
+# import instead of on every get_db_service call.
+_USE_SQLITE = os.getenv("USE_SQLITE", "true").lower() == "true"
+
 
 def get_db_service():
     """Get the appropriate database service based on configuration."""
-    use_sqlite = os.getenv("USE_SQLITE", "true").lower() == "true"
-    
-    if use_sqlite:
+    if _USE_SQLITE:
         from .sqlite_service import get_sqlite_service
         return get_sqlite_service()
     else:
@@ -28,9 +50,27 @@ class GraphService:
     """High-level service for graph operations."""
     
     def __init__(self):
+        # db stays eager (init_database needs it at startup); the ingestion
+        # helpers are lazy so read-only workers never build the HTTP client
+        # or load the normalization tables.
         self.db = get_db_service()
-        self.ct_service = get_clinicaltrials_service()
-        self.normalization = get_normalization_service()
+        # Resolve backend capabilities once instead of hasattr-probing on
+        # every request; None means the backend lacks the method.
+        self._db_apply_asset_update = getattr(self.db, "apply_asset_update", None)
+        self._db_set_asset_override = getattr(self.db, "set_asset_override", None)
+        self._db_get_stats = getattr(self.db, "get_stats", None)
+        # Normalized name -> company_id for companies created this process;
+        # ids are deterministic, so a hit skips model construction and the
+        # duplicate upsert. Size-capped like the normalization caches.
+        self._company_id_cache: Dict[str, str] = {}
+
+    @cached_property
+    def ct_service(self):
+        return get_clinicaltrials_service()
+
+    @cached_property
+    def normalization(self):
+        return get_normalization_service()
     
     def init_database(self):
         """Initialize the database schema."""
@@ -73,7 +113,7 @@ class GraphService:
         
         # Search using ALL terms for better recall
         return self.db.get_indication_graph(
-            indication_terms=terms if terms else [indication],
+            indication_terms=terms,
             depth=depth,
             phase_filter=phase_filter,
             modality_filter=modality_filter,
@@ -98,23 +138,38 @@ class GraphService:
         relationship_type: Optional[str] = None,
     ) -> Optional[Dict[str, Any]]:
         """Set user overrides for an asset (modality, targets) and/or set company relationship. Ingestion will not overwrite these."""
-        if not hasattr(self.db, 'set_asset_override'):
+        if self._db_set_asset_override is None:
             return None
-        if modality is not None or targets is not None:
-            self.db.set_asset_override(asset_id, modality=modality, targets=targets)
-        if owner_company_id is not None:
-            rel_type = relationship_type or 'owns'
-            if rel_type == 'owns':
-                self.db.upsert_owns_user_confirmed(owner_company_id, asset_id, confidence=1.0)
-            elif rel_type == 'licenses':
-                self.db.upsert_licenses_user_confirmed(owner_company_id, asset_id, confidence=1.0)
-            elif rel_type == 'uses_as_comparator':
-                # For comparator, we need a trial_id - for user-set, use a placeholder
-                self.db.upsert_uses_as_comparator_user_confirmed(owner_company_id, asset_id)
+        rel_type = relationship_type or 'owns'
+        if self._db_apply_asset_update is not None:
+            # One transaction for overrides plus relationship instead of a
+            # commit per write
+            self._db_apply_asset_update(
+                asset_id,
+                modality=modality,
+                targets=targets,
+                owner_company_id=owner_company_id,
+                relationship_type=rel_type,
+            )
+        else:
+            if modality is not None or targets is not None:
+                self._db_set_asset_override(asset_id, modality=modality, targets=targets)
+            if owner_company_id is not None:
+                if rel_type == 'owns':
+                    self.db.upsert_owns_user_confirmed(owner_company_id, asset_id, confidence=1.0)
+                elif rel_type == 'licenses':
+                    self.db.upsert_licenses_user_confirmed(owner_company_id, asset_id, confidence=1.0)
+                elif rel_type == 'uses_as_comparator':
+                    # For comparator, we need a trial_id - for user-set, use a placeholder
+                    self.db.upsert_uses_as_comparator_user_confirmed(owner_company_id, asset_id)
         return self.get_asset_details(asset_id)
 
     def create_company(self, name: str) -> str:
         """Create or get a company by name (e.g. for adding a new sponsor). Returns company_id."""
+        cache_key = name.strip().casefold()
+        cached = self._company_id_cache.get(cache_key)
+        if cached is not None:
+            return cached
         from ..models.nodes import Company, Evidence
         company_id = Company.generate_id(name)
         company = Company(
@@ -124,8 +179,15 @@ class GraphService:
             evidence=[Evidence(source_type="user_added", confidence=1.0)]
         )
         self.db.upsert_company(company)
+        if len(self._company_id_cache) >= 8192:
+            self._company_id_cache.clear()
+        self._company_id_cache[cache_key] = company_id
         return company_id
 
+    def invalidate_caches(self) -> None:
+        """Drop per-process caches after bulk mutations (e.g. database clear)."""
+        self._company_id_cache.clear()
+
     def get_trial_details(self, trial_id: str) -> Optional[Dict[str, Any]]:
         """Get detailed trial information."""
         return self.db.get_trial(trial_id)
@@ -138,80 +200,23 @@ class GraphService:
         """Get landscape statistics and summary for an indication."""
         terms = settings.get_indication_terms(indication)
         
-        stats = self.db.get_landscape_stats(terms if terms else [indication])
+        stats = self.db.get_landscape_stats(terms)
         
         # Add standard of care info (placeholder for POC)
         stats["standard_of_care"] = {
             "available": False,
             "note": "Standard of care information requires validated medical sources and is not yet implemented.",
-            "placeholder_info": self._get_soc_placeholder(indication)
+            "placeholder_info": _load_soc().get(indication)
         }
         
         return stats
     
-    def _get_soc_placeholder(self, indication: str) -> Optional[Dict[str, Any]]:
-        """
-        Get placeholder SoC info for known indications.
-        These are marked as needing verified sources.
-        """
-        soc_data = {
-            "MuM": {
-                "indication_full_name": "Metastatic Uveal Melanoma / Mucosal Melanoma",
-                "needs_citation": True,
-                "summary": (
-                    "For metastatic uveal melanoma, treatment options are limited. "
-                    "Tebentafusp (Kimmtrak) is approved for HLA-A*02:01-positive patients. "
-                    "Other approaches include checkpoint inhibitors (pembrolizumab, ipilimumab + nivolumab), "
-                    "though response rates are generally lower than in cutaneous melanoma. "
-                    "Liver-directed therapies may be considered for hepatic metastases."
-                ),
-                "key_agents": [
-                    {"name": "Tebentafusp", "approved": True, "notes": "FDA approved 2022 for HLA-A*02:01+ mUM"},
-                    {"name": "Pembrolizumab", "approved": False, "notes": "Used off-label; limited efficacy"},
-                    {"name": "Ipilimumab + Nivolumab", "approved": False, "notes": "Combination checkpoint therapy"}
-                ],
-                "disclaimer": (
-                    "NEEDS CITED SOURCES - This information is for demonstration only. "
-                    "Treatment decisions should be based on current NCCN guidelines and consultation "
-                    "with qualified oncologists."
-                )
-            }
-        }
-        
-        return soc_data.get(indication)
-    
     def get_stats(self) -> Dict[str, int]:
         """Get overall database statistics."""
-        # Use the db service's get_stats if available
-        if hasattr(self.db, 'get_stats'):
-            return self.db.get_stats()
-        
-        # Fallback for Neo4j
-        try:
-            query = """
-            MATCH (c:Company) WITH count(c) as companies
-            MATCH (a:Asset) WITH companies, count(a) as assets
-            MATCH (t:Trial) WITH companies, assets, count(t) as trials
-            MATCH (d:Deal) WITH companies, assets, trials, count(d) as deals
-            MATCH (doc:Document) WITH companies, assets, trials, deals, count(doc) as documents
-            RETURN companies, assets, trials, deals, documents
-            """
-            
-            with self.db.session() as session:
-                result = session.run(query)
-                record = result.single()
-                
-                if record:
-                    return {
-                        "companies": record["companies"],
-                        "assets": record["assets"],
-                        "trials": record["trials"],
-                        "deals": record["deals"],
-                        "documents": record["documents"]
-                    }
-        except Exception as e:
-            logger.warning(f"Failed to get stats: {e}")
-        
+        # Both backends expose get_stats; the guard keeps alternative
+        # storage services working without it.
+        if self._db_get_stats is not None:
+            return self._db_get_stats()
         return {"companies": 0, "assets": 0, "trials": 0, "deals": 0, "documents": 0}
 
 
@@ -225,3 +230,9 @@ def get_graph_service() -> GraphService:
     if _graph_service is None:
         _graph_service = GraphService()
     return _graph_service
+
+
+def reset_graph_service() -> None:
+    """Drop the singleton so the next get_graph_service() rebuilds it (tests)."""
+    global _graph_service
+    _graph_service = None
@@ -0,0 +1,75 @@
+"""
+In-memory registry for background ingestion jobs.
+Lets the ingest endpoint return immediately and clients poll for progress
+instead of holding an HTTP request open for the whole ingestion run.
+"""
+import threading
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+
+
+class IngestJobRegistry:
+    """Thread-safe store of ingestion job records, keyed by job id."""
+
+    def __init__(self):
+        self._jobs: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def create(self, indication: str) -> str:
+        """Register a new queued job and return its id."""
+        job_id = uuid.uuid4().hex
+        with self._lock:
+            self._jobs[job_id] = {
+                "job_id": job_id,
+                "indication": indication,
+                "status": "queued",
+                "stats": {},
+                "error": None,
+                "created_at": datetime.now(timezone.utc).isoformat(),
+                "finished_at": None
+            }
+        return job_id
+
+    def mark_running(self, job_id: str) -> None:
+        """Mark a job as running."""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job:
+                job["status"] = "running"
+
+    def mark_completed(self, job_id: str, stats: Dict[str, Any]) -> None:
+        """Mark a job as completed with its final ingestion stats."""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job:
+                job["status"] = "completed"
+                job["stats"] = stats
+                job["finished_at"] = datetime.now(timezone.utc).isoformat()
+
+    def mark_failed(self, job_id: str, error: str) -> None:
+        """Mark a job as failed with the error message."""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job:
+                job["status"] = "failed"
+                job["error"] = error
+                job["finished_at"] = datetime.now(timezone.utc).isoformat()
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Return a copy of the job record, or None if unknown."""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return dict(job) if job else None
+
+
+# Singleton instance
+_ingest_job_registry: Optional[IngestJobRegistry] = None
+
+
+def get_ingest_job_registry() -> IngestJobRegistry:
+    """Get or create the shared ingest job registry singleton."""
+    global _ingest_job_registry
+    if _ingest_job_registry is None:
+        _ingest_job_registry = IngestJobRegistry()
+    return _ingest_job_registry
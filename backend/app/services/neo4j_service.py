@@ -2,296 +2,603 @@
 Neo4j database service for graph storage and queries.
 """
 import logging
+import threading
+from itertools import chain
 from typing import List, Dict, Any, Optional
 from contextlib import contextmanager
 from neo4j import GraphDatabase, Driver
-from neo4j.exceptions import ServiceUnavailable
+from neo4j.exceptions import ServiceUnavailable, ClientError
 
 from ..config import settings
+from .cache import TTLCache
 from ..models.nodes import Company, Asset, Deal, Document, Trial
-from ..models.edges import PartyTo, Covers, SupportedBy, Owns, HasTrial, SponsorsTrial
+from ..models.edges import (
+    PartyTo, Covers, SupportedBy, Owns, HasTrial, SponsorsTrial,
+    ParticipatesInTrial, UsesAsComparator
+)
 
 logger = logging.getLogger(__name__)
 
+# One UNWIND statement per batch amortizes driver round-trips, transaction
+# begin/commit, and plan-cache lookups across the whole batch instead of
+# paying them per row.
+_BULK_BATCH_SIZE = 1000
+
+
+def _batched(items: List[Any], size: int = _BULK_BATCH_SIZE):
+    """Yield successive slices of at most `size` items (one write tx each)."""
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def _evidence_json(evidence) -> List[str]:
+    """Serialize evidence models once per entity (stored as JSON strings)."""
+    return [e.model_dump_json() for e in evidence]
+
+
+# Constant text so Neo4j's plan cache hits on every stats call; CALL
+# subqueries let each count come from the label count store.
+_STATS_CYPHER = """
+CALL { MATCH (c:Company) RETURN count(c) AS companies }
+CALL { MATCH (a:Asset) RETURN count(a) AS assets }
+CALL { MATCH (t:Trial) RETURN count(t) AS trials }
+CALL { MATCH (d:Deal) RETURN count(d) AS deals }
+CALL { MATCH (doc:Document) RETURN count(doc) AS documents }
+RETURN companies, assets, trials, deals, documents
+"""
+
+
+# Trial selection by indication: the fulltext stanza hits the
+# trial_conditions index (analyzer lowercases both sides, so no toLower);
+# the scan stanza is the pre-index slow path kept as a fallback for
+# databases whose schema predates the index.
+_INDICATION_MATCH_FULLTEXT = """
+CALL db.index.fulltext.queryNodes("trial_conditions", $indication) YIELD node AS t
+WHERE $phases IS NULL OR t.phase IN $phases
+WITH t LIMIT $limit
+"""
+
+_INDICATION_MATCH_SCAN = """
+MATCH (t:Trial)
+WHERE any(cond IN t.conditions WHERE toLower(cond) CONTAINS toLower($indication))
+  AND ($phases IS NULL OR t.phase IN $phases)
+WITH t LIMIT $limit
+"""
+
+# get_indication_graph: fixed query texts (fulltext/scan x with/without the
+# deal expansion) so Neo4j's plan cache is keyed on at most four strings
+# instead of one per filter combination. Filters are parameters -
+# `$phases IS NULL` / `$modalities IS NULL` means "no filter" - which also
+# closes the Cypher injection hole the old string concatenation left open.
+_INDICATION_GRAPH_BASE = """
+// Get assets linked to these trials
+OPTIONAL MATCH (a:Asset)-[:HAS_TRIAL]->(t)
+WHERE $modalities IS NULL OR a.modality IN $modalities
+
+// Get companies sponsoring these trials
+OPTIONAL MATCH (c:Company)-[st:SPONSORS_TRIAL]->(t)
+
+// Get ownership relationships
+OPTIONAL MATCH (c2:Company)-[o:OWNS]->(a)
+"""
+
+# properties() maps arrive as plain dicts from the driver, skipping the
+# Node wrapper and the per-entity dict() walk in Python.
+_INDICATION_GRAPH_ROWS = """
+RETURN DISTINCT properties(t) AS t, properties(a) AS a, properties(c) AS c,
+       properties(c2) AS c2, properties(o) AS o, st.role AS sponsor_role
+"""
+
+_INDICATION_GRAPH_DEALS_TAIL = """
+// Deal expansion (depth > 1)
+OPTIONAL MATCH (c)-[pt:PARTY_TO]->(d:Deal)-[cov:COVERS]->(a)
+
+RETURN DISTINCT properties(t) AS t, properties(a) AS a, properties(c) AS c,
+       properties(c2) AS c2, properties(o) AS o, st.role AS sponsor_role,
+       properties(d) AS d, pt.role AS party_role
+"""
+
+# Keyed by (use_fulltext, with_deals). Rows stream back one match
+# combination at a time; the old collect(...)-everything single record
+# forced the server to buffer the whole result in heap and the driver to
+# hand it over as one giant value.
+_INDICATION_GRAPH_QUERIES = {
+    (use_ft, with_deals): (
+        (_INDICATION_MATCH_FULLTEXT if use_ft else _INDICATION_MATCH_SCAN)
+        + _INDICATION_GRAPH_BASE
+        + (_INDICATION_GRAPH_DEALS_TAIL if with_deals else _INDICATION_GRAPH_ROWS)
+    )
+    for use_ft in (True, False)
+    for with_deals in (True, False)
+}
+
+
+# search_all: one statement instead of three round-trips; each branch is
+# ordered and limited inside the CALL subquery, then bucketed by kind in
+# Python. trial_conditions covers both title and conditions.
+_SEARCH_ALL_CYPHER = """
+CALL {
+    CALL db.index.fulltext.queryNodes("company_search", $query) YIELD node, score
+    WITH node, score ORDER BY score DESC LIMIT $limit
+    RETURN 'company' AS kind, properties(node) AS node, score
+  UNION ALL
+    CALL db.index.fulltext.queryNodes("asset_search", $query) YIELD node, score
+    WITH node, score ORDER BY score DESC LIMIT $limit
+    RETURN 'asset' AS kind, properties(node) AS node, score
+  UNION ALL
+    CALL db.index.fulltext.queryNodes("trial_conditions", $query) YIELD node, score
+    WITH node, score ORDER BY score DESC LIMIT $limit
+    RETURN 'trial' AS kind, properties(node) AS node, score
+}
+RETURN kind, node, score
+"""
+
+
+# get_landscape_stats used to run five queries, each repeating the same
+# trial-by-indication selection. One query materializes the trial set once
+# (`ts`) and feeds it to each aggregation via CALL subqueries: one
+# round-trip, one traversal of the indication. Keyed True=fulltext,
+# False=pre-index scan fallback.
+_LANDSCAPE_STATS_BODY = """
+WITH collect(DISTINCT t) AS ts
+CALL {
+    WITH ts
+    UNWIND ts AS t
+    WITH t.phase AS phase, count(*) AS cnt WHERE phase IS NOT NULL
+    WITH phase, cnt ORDER BY cnt DESC
+    RETURN collect({phase: phase, count: cnt}) AS phases
+}
+CALL {
+    WITH ts
+    UNWIND ts AS t
+    MATCH (c:Company)-[:SPONSORS_TRIAL]->(t)
+    WITH c, count(t) AS trial_count ORDER BY trial_count DESC LIMIT 20
+    RETURN collect({sponsor: c.name, id: c.company_id, trial_count: trial_count}) AS sponsors
+}
+CALL {
+    WITH ts
+    UNWIND ts AS t
+    MATCH (a:Asset)-[:HAS_TRIAL]->(t)
+    WHERE a.modality IS NOT NULL
+    WITH a.modality AS modality, count(DISTINCT a) AS cnt
+    WITH modality, cnt ORDER BY cnt DESC
+    RETURN collect({modality: modality, count: cnt}) AS modalities
+}
+CALL {
+    WITH ts
+    UNWIND ts AS t
+    MATCH (a:Asset)-[:HAS_TRIAL]->(t)
+    WHERE a.targets IS NOT NULL AND size(a.targets) > 0
+    UNWIND a.targets AS target
+    WITH target, count(DISTINCT a) AS cnt ORDER BY cnt DESC LIMIT 15
+    RETURN collect({target: target, count: cnt}) AS targets
+}
+CALL {
+    WITH ts
+    UNWIND ts AS t
+    OPTIONAL MATCH (a:Asset)-[:HAS_TRIAL]->(t)
+    OPTIONAL MATCH (c:Company)-[:SPONSORS_TRIAL]->(t)
+    RETURN count(DISTINCT t) AS total_trials,
+           count(DISTINCT a) AS total_assets,
+           count(DISTINCT c) AS total_companies
+}
+RETURN phases, sponsors, modalities, targets,
+       total_trials, total_assets, total_companies
+"""
+
+_LANDSCAPE_STATS_QUERIES = {
+    True: """
+CALL db.index.fulltext.queryNodes("trial_conditions", $indication) YIELD node AS t
+""" + _LANDSCAPE_STATS_BODY,
+    False: """
+MATCH (t:Trial)
+WHERE any(cond IN t.conditions WHERE toLower(cond) CONTAINS toLower($indication))
+""" + _LANDSCAPE_STATS_BODY,
+}
+
 
 class Neo4jService:
     """Service for Neo4j database operations."""
     
+    # The Bolt driver is thread-safe and meant to be one per process: it owns
+    # the connection pool. Class-level with a lock so any stray extra
+    # Neo4jService instance shares it instead of opening a second pool.
     _driver: Optional[Driver] = None
+    _driver_lock = threading.Lock()
     
+    # Entity reads fire multi-OPTIONAL-MATCH queries and the UI re-requests
+    # the same ids repeatedly, so found results are cached briefly. Upserts
+    # invalidate their own ids; edge-only writes are bounded by the TTL.
+    _ENTITY_CACHE_TTL = 60.0
+
     def __init__(self):
         """Initialize Neo4j connection."""
+        self._bulk_session = None  # set while inside bulk()
+        self._entity_cache = TTLCache(default_ttl=self._ENTITY_CACHE_TTL)
         self._connect()
     
     def _connect(self):
-        """Establish connection to Neo4j."""
-        try:
-            self._driver = GraphDatabase.driver(
-                settings.neo4j_uri,
-                auth=(settings.neo4j_user, settings.neo4j_password)
-            )
-            # Verify connectivity
-            self._driver.verify_connectivity()
-            logger.info(f"Connected to Neo4j at {settings.neo4j_uri}")
-        except ServiceUnavailable as e:
-            logger.error(f"Failed to connect to Neo4j: {e}")
-            raise
+        """Establish the process-wide Bolt driver (no-op if already up)."""
+        with Neo4jService._driver_lock:
+            if Neo4jService._driver is not None:
+                return
+            try:
+                Neo4jService._driver = GraphDatabase.driver(
+                    settings.neo4j_uri,
+                    auth=(settings.neo4j_user, settings.neo4j_password),
+                    max_connection_pool_size=settings.neo4j_max_pool_size,
+                    connection_acquisition_timeout=settings.neo4j_acquire_timeout,
+                    max_connection_lifetime=settings.neo4j_max_lifetime,
+                    keep_alive=True
+                )
+                # Verify connectivity
+                Neo4jService._driver.verify_connectivity()
+                logger.info("Connected to Neo4j at %s", settings.neo4j_uri)
+            except ServiceUnavailable as e:
+                if Neo4jService._driver is not None:
+                    Neo4jService._driver.close()
+                    Neo4jService._driver = None
+                logger.error("Failed to connect to Neo4j: %s", e)
+                raise
     
     def close(self):
-        """Close the Neo4j connection."""
-        if self._driver:
-            self._driver.close()
+        """Close the shared driver. Application-shutdown only: the driver is
+        process-wide, so per-request callers must never close it."""
+        with Neo4jService._driver_lock:
+            if Neo4jService._driver:
+                Neo4jService._driver.close()
+                Neo4jService._driver = None
     
     @contextmanager
     def session(self):
-        """Get a Neo4j session context manager."""
-        session = self._driver.session()
+        """Get a Neo4j session context manager (results stream in 1k-record batches)."""
+        session = self._driver.session(fetch_size=1000)
         try:
             yield session
         finally:
             session.close()
+
+    @contextmanager
+    def bulk(self):
+        """Hold one session open across several *_bulk calls.
+
+        A buffer flush runs up to nine bulk statements back to back; without
+        this each one borrows and returns its own session. Nesting is safe -
+        the outermost context owns the session.
+        """
+        if self._bulk_session is not None:
+            yield self
+            return
+        session = self._driver.session()
+        try:
+            self._bulk_session = session
+            yield self
+        finally:
+            self._bulk_session = None
+            session.close()
     
+    def get_stats(self) -> Dict[str, int]:
+        """Get overall database statistics via one managed query."""
+        try:
+            records, _, _ = self._driver.execute_query(_STATS_CYPHER)
+        except ServiceUnavailable as e:
+            logger.warning("Failed to get stats: %s", e)
+            return {"companies": 0, "assets": 0, "trials": 0, "deals": 0, "documents": 0}
+        record = records[0]
+        return {
+            "companies": record["companies"],
+            "assets": record["assets"],
+            "trials": record["trials"],
+            "deals": record["deals"],
+            "documents": record["documents"]
+        }
+
     def init_schema(self):
         """Initialize database schema with indexes and constraints."""
         with self.session() as session:
-            # Create indexes for each node type
+            # Create constraints and indexes for each node type. Unique
+            # constraints on the id keys give MERGE/MATCH a
+            # NodeUniqueIndexSeek (and guard against duplicate nodes); the
+            # constraint-backed index replaces the plain id index.
             indexes = [
-                "CREATE INDEX company_id IF NOT EXISTS FOR (c:Company) ON (c.company_id)",
+                "CREATE CONSTRAINT company_id_unique IF NOT EXISTS FOR (c:Company) REQUIRE c.company_id IS UNIQUE",
+                "CREATE CONSTRAINT asset_id_unique IF NOT EXISTS FOR (a:Asset) REQUIRE a.asset_id IS UNIQUE",
+                "CREATE CONSTRAINT trial_id_unique IF NOT EXISTS FOR (t:Trial) REQUIRE t.trial_id IS UNIQUE",
+                "CREATE CONSTRAINT deal_id_unique IF NOT EXISTS FOR (d:Deal) REQUIRE d.deal_id IS UNIQUE",
+                "CREATE CONSTRAINT doc_id_unique IF NOT EXISTS FOR (d:Document) REQUIRE d.doc_id IS UNIQUE",
                 "CREATE INDEX company_name IF NOT EXISTS FOR (c:Company) ON (c.name)",
-                "CREATE INDEX asset_id IF NOT EXISTS FOR (a:Asset) ON (a.asset_id)",
                 "CREATE INDEX asset_name IF NOT EXISTS FOR (a:Asset) ON (a.name)",
-                "CREATE INDEX deal_id IF NOT EXISTS FOR (d:Deal) ON (d.deal_id)",
-                "CREATE INDEX trial_id IF NOT EXISTS FOR (t:Trial) ON (t.trial_id)",
-                "CREATE INDEX doc_id IF NOT EXISTS FOR (d:Document) ON (d.doc_id)",
+                # Range indexes for the filters the graph/landscape queries
+                # apply after the indication lookup
+                "CREATE RANGE INDEX trial_phase IF NOT EXISTS FOR (t:Trial) ON (t.phase)",
+                "CREATE RANGE INDEX trial_phase_status IF NOT EXISTS FOR (t:Trial) ON (t.phase, t.status)",
+                "CREATE RANGE INDEX asset_modality IF NOT EXISTS FOR (a:Asset) ON (a.modality)",
+                "CREATE RANGE INDEX deal_announce IF NOT EXISTS FOR (d:Deal) ON (d.announce_date)",
                 # Full-text search indexes
                 "CREATE FULLTEXT INDEX company_search IF NOT EXISTS FOR (c:Company) ON EACH [c.name, c.aliases]",
                 "CREATE FULLTEXT INDEX asset_search IF NOT EXISTS FOR (a:Asset) ON EACH [a.name, a.synonyms]",
+                "CREATE FULLTEXT INDEX trial_conditions IF NOT EXISTS FOR (t:Trial) ON EACH [t.conditions, t.title]",
             ]
             for idx in indexes:
                 try:
                     session.run(idx)
                 except Exception as e:
-                    logger.warning(f"Index creation warning: {e}")
+                    logger.warning("Index creation warning: %s", e)
             
             logger.info("Neo4j schema initialized")
     
     # ==================== Node Operations ====================
-    
+    # Single-entity methods are thin wrappers over the bulk forms below;
+    # ingestion should buffer and call the *_bulk methods directly.
+
     def upsert_company(self, company: Company) -> str:
         """Insert or update a Company node."""
-        query = """
-        MERGE (c:Company {company_id: $company_id})
-        SET c.name = $name,
-            c.aliases = $aliases,
-            c.country = $country,
-            c.public_flag = $public_flag,
-            c.tickers = $tickers,
-            c.cik = $cik,
-            c.status = $status,
-            c.evidence = $evidence,
-            c.updated_at = datetime()
-        RETURN c.company_id as id
-        """
-        with self.session() as session:
-            result = session.run(query, 
-                company_id=company.company_id,
-                name=company.name,
-                aliases=company.aliases,
-                country=company.country,
-                public_flag=company.public_flag,
-                tickers=company.tickers,
-                cik=company.cik,
-                status=company.status,
-                evidence=[e.model_dump_json() for e in company.evidence]
-            )
-            record = result.single()
-            return record["id"] if record else company.company_id
-    
+        self.upsert_companies_bulk([company])
+        return company.company_id
+
     def upsert_asset(self, asset: Asset) -> str:
         """Insert or update an Asset node."""
-        query = """
-        MERGE (a:Asset {asset_id: $asset_id})
-        SET a.name = $name,
-            a.synonyms = $synonyms,
-            a.modality = $modality,
-            a.targets = $targets,
-            a.indications = $indications,
-            a.stage_current = $stage_current,
-            a.modality_confidence = $modality_confidence,
-            a.targets_confidence = $targets_confidence,
-            a.evidence = $evidence,
-            a.updated_at = datetime()
-        RETURN a.asset_id as id
-        """
-        with self.session() as session:
-            result = session.run(query,
-                asset_id=asset.asset_id,
-                name=asset.name,
-                synonyms=asset.synonyms,
-                modality=asset.modality,
-                targets=asset.targets,
-                indications=asset.indications,
-                stage_current=asset.stage_current,
-                modality_confidence=asset.modality_confidence,
-                targets_confidence=asset.targets_confidence,
-                evidence=[e.model_dump_json() for e in asset.evidence]
-            )
-            record = result.single()
-            return record["id"] if record else asset.asset_id
-    
+        self.upsert_assets_bulk([asset])
+        return asset.asset_id
+
     def upsert_trial(self, trial: Trial) -> str:
         """Insert or update a Trial node."""
-        query = """
-        MERGE (t:Trial {trial_id: $trial_id})
-        SET t.title = $title,
-            t.phase = $phase,
-            t.status = $status,
-            t.start_date = $start_date,
-            t.completion_date = $completion_date,
-            t.interventions = $interventions,
-            t.conditions = $conditions,
-            t.sponsors = $sponsors,
-            t.collaborators = $collaborators,
-            t.enrollment = $enrollment,
-            t.study_type = $study_type,
-            t.brief_summary = $brief_summary,
-            t.source_url = $source_url,
-            t.evidence = $evidence,
-            t.updated_at = datetime()
-        RETURN t.trial_id as id
-        """
-        with self.session() as session:
-            result = session.run(query,
-                trial_id=trial.trial_id,
-                title=trial.title,
-                phase=trial.phase,
-                status=trial.status,
-                start_date=str(trial.start_date) if trial.start_date else None,
-                completion_date=str(trial.completion_date) if trial.completion_date else None,
-                interventions=trial.interventions,
-                conditions=trial.conditions,
-                sponsors=trial.sponsors,
-                collaborators=trial.collaborators,
-                enrollment=trial.enrollment,
-                study_type=trial.study_type,
-                brief_summary=trial.brief_summary,
-                source_url=trial.source_url,
-                evidence=[e.model_dump_json() for e in trial.evidence]
-            )
-            record = result.single()
-            return record["id"] if record else trial.trial_id
-    
+        self.upsert_trials_bulk([trial])
+        return trial.trial_id
+
     def upsert_document(self, doc: Document) -> str:
         """Insert or update a Document node."""
-        query = """
-        MERGE (d:Document {doc_id: $doc_id})
-        SET d.doc_type = $doc_type,
-            d.publisher = $publisher,
-            d.url = $url,
-            d.published_at = $published_at,
-            d.retrieved_at = $retrieved_at,
-            d.text_hash = $text_hash,
-            d.updated_at = datetime()
-        RETURN d.doc_id as id
-        """
-        with self.session() as session:
-            result = session.run(query,
-                doc_id=doc.doc_id,
-                doc_type=doc.doc_type,
-                publisher=doc.publisher,
-                url=doc.url,
-                published_at=str(doc.published_at) if doc.published_at else None,
-                retrieved_at=str(doc.retrieved_at),
-                text_hash=doc.text_hash
-            )
-            record = result.single()
-            return record["id"] if record else doc.doc_id
-    
+        self.upsert_documents_bulk([doc])
+        return doc.doc_id
+
     def upsert_deal(self, deal: Deal) -> str:
         """Insert or update a Deal node."""
+        self.upsert_deals_bulk([deal])
+        return deal.deal_id
+
+    # ==================== Bulk Operations ====================
+    # Per-entity MERGEs cost one round-trip and one transaction each; during
+    # ingestion that dominates wall time. The bulk variants send one UNWIND
+    # statement per 1k rows so driver RTT, tx overhead, and planning are paid
+    # once per batch.
+
+    def _run_bulk(self, query: str, rows: List[Dict[str, Any]]) -> None:
+        """Run an UNWIND write statement over `rows` in batched write
+        transactions, on the shared bulk() session when one is active."""
+        if not rows:
+            return
+
+        def run(session):
+            for batch in _batched(rows):
+                session.execute_write(
+                    lambda tx, b=batch: tx.run(query, rows=b).consume()
+                )
+
+        if self._bulk_session is not None:
+            run(self._bulk_session)
+        else:
+            with self.session() as session:
+                run(session)
+
+    def upsert_companies_bulk(self, companies: List[Company]) -> None:
+        """Insert or update a batch of Company nodes."""
         query = """
-        MERGE (d:Deal {deal_id: $deal_id})
-        SET d.deal_type = $deal_type,
-            d.announce_date = $announce_date,
-            d.summary = $summary,
-            d.status = $status,
-            d.value_usd = $value_usd,
-            d.evidence = $evidence,
-            d.updated_at = datetime()
-        RETURN d.deal_id as id
+        UNWIND $rows AS row
+        MERGE (c:Company {company_id: row.company_id})
+        SET c += row.props, c.updated_at = datetime()
         """
-        with self.session() as session:
-            result = session.run(query,
-                deal_id=deal.deal_id,
-                deal_type=deal.deal_type,
-                announce_date=str(deal.announce_date) if deal.announce_date else None,
-                summary=deal.summary,
-                status=deal.status,
-                value_usd=deal.value_usd,
-                evidence=[e.model_dump_json() for e in deal.evidence]
-            )
-            record = result.single()
-            return record["id"] if record else deal.deal_id
-    
-    # ==================== Edge Operations ====================
-    
-    def create_sponsors_trial(self, rel: SponsorsTrial):
-        """Create SPONSORS_TRIAL relationship."""
+        for company in companies:
+            self._entity_cache.pop(("company", company.company_id))
+        self._run_bulk(query, [{
+            "company_id": company.company_id,
+            "props": {
+                "name": company.name,
+                "aliases": company.aliases,
+                "country": company.country,
+                "public_flag": company.public_flag,
+                "tickers": company.tickers,
+                "cik": company.cik,
+                "status": company.status,
+                "evidence": _evidence_json(company.evidence),
+            },
+        } for company in companies])
+
+    def upsert_assets_bulk(self, assets: List[Asset]) -> None:
+        """Insert or update a batch of Asset nodes."""
         query = """
-        MATCH (c:Company {company_id: $company_id})
-        MATCH (t:Trial {trial_id: $trial_id})
+        UNWIND $rows AS row
+        MERGE (a:Asset {asset_id: row.asset_id})
+        SET a += row.props, a.updated_at = datetime()
+        """
+        for asset in assets:
+            self._entity_cache.pop(("asset", asset.asset_id))
+        self._run_bulk(query, [{
+            "asset_id": asset.asset_id,
+            "props": {
+                "name": asset.name,
+                "synonyms": asset.synonyms,
+                "modality": asset.modality,
+                "targets": asset.targets,
+                "indications": asset.indications,
+                "stage_current": asset.stage_current,
+                "modality_confidence": asset.modality_confidence,
+                "targets_confidence": asset.targets_confidence,
+                "evidence": _evidence_json(asset.evidence),
+            },
+        } for asset in assets])
+
+    def upsert_trials_bulk(self, trials: List[Trial]) -> None:
+        """Insert or update a batch of Trial nodes."""
+        query = """
+        UNWIND $rows AS row
+        MERGE (t:Trial {trial_id: row.trial_id})
+        SET t += row.props, t.updated_at = datetime()
+        """
+        for trial in trials:
+            self._entity_cache.pop(("trial", trial.trial_id))
+        self._run_bulk(query, [{
+            "trial_id": trial.trial_id,
+            "props": {
+                "title": trial.title,
+                "phase": trial.phase,
+                "status": trial.status,
+                "start_date": str(trial.start_date) if trial.start_date else None,
+                "completion_date": str(trial.completion_date) if trial.completion_date else None,
+                "interventions": trial.interventions,
+                "conditions": trial.conditions,
+                "sponsors": trial.sponsors,
+                "collaborators": trial.collaborators,
+                "enrollment": trial.enrollment,
+                "study_type": trial.study_type,
+                "brief_summary": trial.brief_summary,
+                "source_url": trial.source_url,
+                "evidence": _evidence_json(trial.evidence),
+            },
+        } for trial in trials])
+
+    def upsert_documents_bulk(self, docs: List[Document]) -> None:
+        """Insert or update a batch of Document nodes."""
+        query = """
+        UNWIND $rows AS row
+        MERGE (d:Document {doc_id: row.doc_id})
+        SET d += row.props, d.updated_at = datetime()
+        """
+        self._run_bulk(query, [{
+            "doc_id": doc.doc_id,
+            "props": {
+                "doc_type": doc.doc_type,
+                "publisher": doc.publisher,
+                "url": doc.url,
+                "published_at": str(doc.published_at) if doc.published_at else None,
+                "retrieved_at": str(doc.retrieved_at),
+                "text_hash": doc.text_hash,
+            },
+        } for doc in docs])
+
+    def upsert_deals_bulk(self, deals: List[Deal]) -> None:
+        """Insert or update a batch of Deal nodes."""
+        query = """
+        UNWIND $rows AS row
+        MERGE (d:Deal {deal_id: row.deal_id})
+        SET d += row.props, d.updated_at = datetime()
+        """
+        self._run_bulk(query, [{
+            "deal_id": deal.deal_id,
+            "props": {
+                "deal_type": deal.deal_type,
+                "announce_date": str(deal.announce_date) if deal.announce_date else None,
+                "summary": deal.summary,
+                "status": deal.status,
+                "value_usd": deal.value_usd,
+                "evidence": _evidence_json(deal.evidence),
+            },
+        } for deal in deals])
+
+    def create_sponsors_trial_bulk(self, rels: List[SponsorsTrial]) -> None:
+        """Create a batch of SPONSORS_TRIAL relationships."""
+        query = """
+        UNWIND $rows AS row
+        MATCH (c:Company {company_id: row.company_id})
+        MATCH (t:Trial {trial_id: row.trial_id})
         MERGE (c)-[r:SPONSORS_TRIAL]->(t)
-        SET r.role = $role,
-            r.evidence = $evidence
+        SET r += row.props
         """
-        with self.session() as session:
-            session.run(query,
-                company_id=rel.company_id,
-                trial_id=rel.trial_id,
-                role=rel.role,
-                evidence=[e.model_dump_json() for e in rel.evidence]
-            )
-    
-    def create_has_trial(self, rel: HasTrial):
-        """Create HAS_TRIAL relationship."""
+        self._run_bulk(query, [{
+            "company_id": rel.company_id,
+            "trial_id": rel.trial_id,
+            "props": {"role": rel.role, "evidence": _evidence_json(rel.evidence)},
+        } for rel in rels])
+
+    def create_participates_in_trial_bulk(self, rels: List[ParticipatesInTrial]) -> None:
+        """Create a batch of PARTICIPATES_IN_TRIAL relationships."""
         query = """
-        MATCH (a:Asset {asset_id: $asset_id})
-        MATCH (t:Trial {trial_id: $trial_id})
+        UNWIND $rows AS row
+        MATCH (c:Company {company_id: row.company_id})
+        MATCH (t:Trial {trial_id: row.trial_id})
+        MERGE (c)-[r:PARTICIPATES_IN_TRIAL]->(t)
+        SET r += row.props
+        """
+        self._run_bulk(query, [{
+            "company_id": rel.company_id,
+            "trial_id": rel.trial_id,
+            "props": {"role": rel.role, "evidence": _evidence_json(rel.evidence)},
+        } for rel in rels])
+
+    def create_has_trial_bulk(self, rels: List[HasTrial]) -> None:
+        """Create a batch of HAS_TRIAL relationships."""
+        query = """
+        UNWIND $rows AS row
+        MATCH (a:Asset {asset_id: row.asset_id})
+        MATCH (t:Trial {trial_id: row.trial_id})
         MERGE (a)-[r:HAS_TRIAL]->(t)
-        SET r.evidence = $evidence
+        SET r += row.props
         """
-        with self.session() as session:
-            session.run(query,
-                asset_id=rel.asset_id,
-                trial_id=rel.trial_id,
-                evidence=[e.model_dump_json() for e in rel.evidence]
-            )
-    
-    def create_owns(self, rel: Owns):
-        """Create OWNS relationship."""
+        self._run_bulk(query, [{
+            "asset_id": rel.asset_id,
+            "trial_id": rel.trial_id,
+            "props": {"evidence": _evidence_json(rel.evidence)},
+        } for rel in rels])
+
+    def create_owns_bulk(self, rels: List[Owns]) -> None:
+        """Create a batch of OWNS relationships."""
         query = """
-        MATCH (c:Company {company_id: $company_id})
-        MATCH (a:Asset {asset_id: $asset_id})
+        UNWIND $rows AS row
+        MATCH (c:Company {company_id: row.company_id})
+        MATCH (a:Asset {asset_id: row.asset_id})
         MERGE (c)-[r:OWNS]->(a)
-        SET r.from_date = $from_date,
-            r.to_date = $to_date,
-            r.confidence = $confidence,
-            r.source = $source,
-            r.is_current = $is_current,
-            r.evidence = $evidence
+        SET r += row.props
         """
-        with self.session() as session:
-            session.run(query,
-                company_id=rel.company_id,
-                asset_id=rel.asset_id,
-                from_date=str(rel.from_date) if rel.from_date else None,
-                to_date=str(rel.to_date) if rel.to_date else None,
-                confidence=rel.confidence,
-                source=rel.source,
-                is_current=rel.is_current,
-                evidence=[e.model_dump_json() for e in rel.evidence]
-            )
+        self._run_bulk(query, [{
+            "company_id": rel.company_id,
+            "asset_id": rel.asset_id,
+            "props": {
+                "from_date": str(rel.from_date) if rel.from_date else None,
+                "to_date": str(rel.to_date) if rel.to_date else None,
+                "confidence": rel.confidence,
+                "source": rel.source,
+                "is_current": rel.is_current,
+                "evidence": _evidence_json(rel.evidence),
+            },
+        } for rel in rels])
+
+    def create_uses_as_comparator_bulk(self, rels: List[UsesAsComparator]) -> None:
+        """Create a batch of USES_AS_COMPARATOR relationships (keyed per trial)."""
+        query = """
+        UNWIND $rows AS row
+        MATCH (c:Company {company_id: row.company_id})
+        MATCH (a:Asset {asset_id: row.asset_id})
+        MERGE (c)-[r:USES_AS_COMPARATOR {trial_id: row.trial_id}]->(a)
+        SET r += row.props
+        """
+        self._run_bulk(query, [{
+            "company_id": rel.company_id,
+            "asset_id": rel.asset_id,
+            "trial_id": rel.trial_id,
+            "props": {"evidence": _evidence_json(rel.evidence)},
+        } for rel in rels])
+
+    # ==================== Edge Operations ====================
     
+    def create_sponsors_trial(self, rel: SponsorsTrial):
+        """Create SPONSORS_TRIAL relationship."""
+        self.create_sponsors_trial_bulk([rel])
+
+    def create_participates_in_trial(self, rel: ParticipatesInTrial):
+        """Create PARTICIPATES_IN_TRIAL relationship."""
+        self.create_participates_in_trial_bulk([rel])
+
+    def create_has_trial(self, rel: HasTrial):
+        """Create HAS_TRIAL relationship."""
+        self.create_has_trial_bulk([rel])
+
+    def create_owns(self, rel: Owns):
+        """Create OWNS relationship."""
+        self.create_owns_bulk([rel])
+
+    def create_uses_as_comparator(self, rel: UsesAsComparator):
+        """Create USES_AS_COMPARATOR relationship."""
+        self.create_uses_as_comparator_bulk([rel])
+
     def create_party_to(self, rel: PartyTo):
         """Create PARTY_TO relationship."""
         query = """
@@ -306,7 +613,7 @@ class Neo4jService:
                 company_id=rel.company_id,
                 deal_id=rel.deal_id,
                 role=rel.role,
-                evidence=[e.model_dump_json() for e in rel.evidence]
+                evidence=_evidence_json(rel.evidence)
             )
     
     def create_covers(self, rel: Covers):
@@ -321,22 +628,37 @@ class Neo4jService:
             session.run(query,
                 deal_id=rel.deal_id,
                 asset_id=rel.asset_id,
-                evidence=[e.model_dump_json() for e in rel.evidence]
+                evidence=_evidence_json(rel.evidence)
             )
     
     # ==================== Query Operations ====================
     
     def get_company(self, company_id: str) -> Optional[Dict[str, Any]]:
         """Get a company by ID with related data."""
+        cached = self._entity_cache.get(("company", company_id))
+        if cached is not None:
+            return cached
+        # Each related collection runs in its own CALL subquery so the
+        # collects never see each other's rows - three OPTIONAL MATCHes on
+        # one line would materialize the cross product before DISTINCT.
         query = """
         MATCH (c:Company {company_id: $company_id})
-        OPTIONAL MATCH (c)-[st:SPONSORS_TRIAL]->(t:Trial)
-        OPTIONAL MATCH (c)-[o:OWNS]->(a:Asset)
-        OPTIONAL MATCH (c)-[pt:PARTY_TO]->(d:Deal)
-        RETURN c,
-               collect(DISTINCT {trial: t, role: st.role}) as trials,
-               collect(DISTINCT {asset: a, ownership: o}) as assets,
-               collect(DISTINCT {deal: d, role: pt.role}) as deals
+        CALL {
+            WITH c
+            OPTIONAL MATCH (c)-[st:SPONSORS_TRIAL]->(t:Trial)
+            RETURN collect({trial: properties(t), role: st.role}) as trials
+        }
+        CALL {
+            WITH c
+            OPTIONAL MATCH (c)-[o:OWNS]->(a:Asset)
+            RETURN collect({asset: properties(a), ownership: properties(o)}) as assets
+        }
+        CALL {
+            WITH c
+            OPTIONAL MATCH (c)-[pt:PARTY_TO]->(d:Deal)
+            RETURN collect({deal: properties(d), role: pt.role}) as deals
+        }
+        RETURN properties(c) as c, trials, assets, deals
         """
         with self.session() as session:
             result = session.run(query, company_id=company_id)
@@ -344,32 +666,45 @@ class Neo4jService:
             if not record:
                 return None
             
-            company_data = dict(record["c"])
+            company_data = record["c"]
             company_data["trials"] = [
-                {**dict(t["trial"]), "role": t["role"]} 
+                {**t["trial"], "role": t["role"]} 
                 for t in record["trials"] if t["trial"]
             ]
             company_data["assets"] = [
-                {**dict(a["asset"]), "ownership": dict(a["ownership"]) if a["ownership"] else None}
+                {**a["asset"], "ownership": a["ownership"]}
                 for a in record["assets"] if a["asset"]
             ]
             company_data["deals"] = [
-                {**dict(d["deal"]), "role": d["role"]}
+                {**d["deal"], "role": d["role"]}
                 for d in record["deals"] if d["deal"]
             ]
+            self._entity_cache.set(("company", company_id), company_data)
             return company_data
     
     def get_asset(self, asset_id: str) -> Optional[Dict[str, Any]]:
         """Get an asset by ID with related data."""
+        cached = self._entity_cache.get(("asset", asset_id))
+        if cached is not None:
+            return cached
         query = """
         MATCH (a:Asset {asset_id: $asset_id})
-        OPTIONAL MATCH (a)-[:HAS_TRIAL]->(t:Trial)
-        OPTIONAL MATCH (c:Company)-[o:OWNS]->(a)
-        OPTIONAL MATCH (d:Deal)-[:COVERS]->(a)
-        RETURN a,
-               collect(DISTINCT t) as trials,
-               collect(DISTINCT {company: c, ownership: o}) as owners,
-               collect(DISTINCT d) as deals
+        CALL {
+            WITH a
+            OPTIONAL MATCH (a)-[:HAS_TRIAL]->(t:Trial)
+            RETURN collect(properties(t)) as trials
+        }
+        CALL {
+            WITH a
+            OPTIONAL MATCH (c:Company)-[o:OWNS]->(a)
+            RETURN collect({company: properties(c), ownership: properties(o)}) as owners
+        }
+        CALL {
+            WITH a
+            OPTIONAL MATCH (d:Deal)-[:COVERS]->(a)
+            RETURN collect(properties(d)) as deals
+        }
+        RETURN properties(a) as a, trials, owners, deals
         """
         with self.session() as session:
             result = session.run(query, asset_id=asset_id)
@@ -377,24 +712,34 @@ class Neo4jService:
             if not record:
                 return None
             
-            asset_data = dict(record["a"])
-            asset_data["trials"] = [dict(t) for t in record["trials"] if t]
+            asset_data = record["a"]
+            asset_data["trials"] = [t for t in record["trials"] if t]
             asset_data["owners"] = [
-                {**dict(o["company"]), "ownership": dict(o["ownership"]) if o["ownership"] else None}
+                {**o["company"], "ownership": o["ownership"]}
                 for o in record["owners"] if o["company"]
             ]
-            asset_data["deals"] = [dict(d) for d in record["deals"] if d]
+            asset_data["deals"] = [d for d in record["deals"] if d]
+            self._entity_cache.set(("asset", asset_id), asset_data)
             return asset_data
     
     def get_trial(self, trial_id: str) -> Optional[Dict[str, Any]]:
         """Get a trial by ID with related data."""
+        cached = self._entity_cache.get(("trial", trial_id))
+        if cached is not None:
+            return cached
         query = """
         MATCH (t:Trial {trial_id: $trial_id})
-        OPTIONAL MATCH (c:Company)-[st:SPONSORS_TRIAL]->(t)
-        OPTIONAL MATCH (a:Asset)-[:HAS_TRIAL]->(t)
-        RETURN t,
-               collect(DISTINCT {company: c, role: st.role}) as sponsors,
-               collect(DISTINCT a) as assets
+        CALL {
+            WITH t
+            OPTIONAL MATCH (c:Company)-[st:SPONSORS_TRIAL]->(t)
+            RETURN collect({company: properties(c), role: st.role}) as sponsors
+        }
+        CALL {
+            WITH t
+            OPTIONAL MATCH (a:Asset)-[:HAS_TRIAL]->(t)
+            RETURN collect(properties(a)) as assets
+        }
+        RETURN properties(t) as t, sponsors, assets
         """
         with self.session() as session:
             result = session.run(query, trial_id=trial_id)
@@ -402,16 +747,45 @@ class Neo4jService:
             if not record:
                 return None
             
-            trial_data = dict(record["t"])
+            trial_data = record["t"]
             trial_data["sponsors_detail"] = [
-                {**dict(s["company"]), "role": s["role"]}
+                {**s["company"], "role": s["role"]}
                 for s in record["sponsors"] if s["company"]
             ]
-            trial_data["assets"] = [dict(a) for a in record["assets"] if a]
+            trial_data["assets"] = [a for a in record["assets"] if a]
+            self._entity_cache.set(("trial", trial_id), trial_data)
             return trial_data
     
     def search_all(self, query_text: str, limit: int = 20) -> Dict[str, List[Dict]]:
-        """Search across all node types."""
+        """Search across all node types (one fused fulltext query)."""
+        results = {
+            "companies": [],
+            "assets": [],
+            "trials": []
+        }
+        buckets = {
+            "company": results["companies"],
+            "asset": results["assets"],
+            "trial": results["trials"]
+        }
+        with self.session() as session:
+            try:
+                for record in session.run(_SEARCH_ALL_CYPHER, query=query_text, limit=limit):
+                    buckets[record["kind"]].append({
+                        **record["node"],
+                        "score": record["score"]
+                    })
+            except ClientError as e:
+                # One of the fulltext indexes is missing - degrade per type
+                logger.warning("Fused search unavailable, using per-type queries: %s", e)
+                return self._search_all_fallback(session, query_text, limit)
+            except Exception as e:
+                logger.warning("Search failed: %s", e)
+        return results
+
+    def _search_all_fallback(self, session, query_text: str, limit: int) -> Dict[str, List[Dict]]:
+        """Per-type search statements so each branch degrades independently
+        on databases whose schema predates one of the fulltext indexes."""
         results = {
             "companies": [],
             "assets": [],
@@ -437,33 +811,19 @@ class Neo4jService:
         RETURN t as node, 1.0 as score LIMIT $limit
         """
         
-        with self.session() as session:
-            try:
-                for record in session.run(company_query, query=query_text, limit=limit):
-                    results["companies"].append({
-                        **dict(record["node"]),
-                        "score": record["score"]
-                    })
-            except Exception as e:
-                logger.warning(f"Company search failed: {e}")
-            
-            try:
-                for record in session.run(asset_query, query=query_text, limit=limit):
-                    results["assets"].append({
-                        **dict(record["node"]),
-                        "score": record["score"]
-                    })
-            except Exception as e:
-                logger.warning(f"Asset search failed: {e}")
-            
+        for key, query in (
+            ("companies", company_query),
+            ("assets", asset_query),
+            ("trials", trial_query)
+        ):
             try:
-                for record in session.run(trial_query, query=query_text, limit=limit):
-                    results["trials"].append({
+                for record in session.run(query, query=query_text, limit=limit):
+                    results[key].append({
                         **dict(record["node"]),
                         "score": record["score"]
                     })
             except Exception as e:
-                logger.warning(f"Trial search failed: {e}")
+                logger.warning("%s search failed: %s", key.capitalize(), e)
         
         return results
     
@@ -480,289 +840,173 @@ class Neo4jService:
         Get the network graph for an indication.
         Returns nodes and edges for visualization.
         """
-        # Build filter clauses
-        phase_clause = ""
-        if phase_filter:
-            phases = "', '".join(phase_filter)
-            phase_clause = f"AND t.phase IN ['{phases}']"
-        
-        modality_clause = ""
-        if modality_filter:
-            modalities = "', '".join(modality_filter)
-            modality_clause = f"AND a.modality IN ['{modalities}']"
-        
-        # Query for trials matching the indication
-        query = f"""
-        MATCH (t:Trial)
-        WHERE any(cond IN t.conditions WHERE toLower(cond) CONTAINS toLower($indication))
-        {phase_clause}
-        WITH t LIMIT $limit
-        
-        // Get assets linked to these trials
-        OPTIONAL MATCH (a:Asset)-[:HAS_TRIAL]->(t)
-        {modality_clause}
-        
-        // Get companies sponsoring these trials
-        OPTIONAL MATCH (c:Company)-[st:SPONSORS_TRIAL]->(t)
-        
-        // Get ownership relationships
-        OPTIONAL MATCH (c2:Company)-[o:OWNS]->(a)
-        
-        // Get deals if depth > 1
-        {"OPTIONAL MATCH (c)-[pt:PARTY_TO]->(d:Deal)-[cov:COVERS]->(a)" if depth > 1 else ""}
-        
-        RETURN 
-            collect(DISTINCT t) as trials,
-            collect(DISTINCT a) as assets,
-            collect(DISTINCT c) as companies,
-            collect(DISTINCT c2) as owners,
-            collect(DISTINCT {{company: c, trial: t, role: st.role}}) as sponsor_rels,
-            collect(DISTINCT {{asset: a, trial: t}}) as asset_trial_rels,
-            collect(DISTINCT {{company: c2, asset: a, ownership: o}}) as ownership_rels
-            {"," if depth > 1 else ""}
-            {"collect(DISTINCT d) as deals," if depth > 1 else ""}
-            {"collect(DISTINCT {company: c, deal: d, role: pt.role}) as deal_party_rels," if depth > 1 else ""}
-            {"collect(DISTINCT {deal: d, asset: a}) as deal_covers_rels" if depth > 1 else ""}
-        """
-        
-        nodes = []
-        edges = []
-        seen_nodes = set()
-        seen_edges = set()
+        # Keyed by node/edge id: RETURN DISTINCT already dedups rows server-
+        # side, so one dict lookup per entity replaces the old seen-set +
+        # list bookkeeping.
+        nodes: Dict[str, Dict[str, Any]] = {}
+        edges: Dict[str, Dict[str, Any]] = {}
+        with_deals = depth > 1
         
         with self.session() as session:
-            result = session.run(query, indication=indication, limit=limit)
-            record = result.single()
+            params = {
+                "indication": indication,
+                "limit": limit,
+                "phases": phase_filter or None,
+                "modalities": modality_filter or None
+            }
+            try:
+                result = session.run(_INDICATION_GRAPH_QUERIES[(True, with_deals)], **params)
+                records = iter(result)
+                first = next(records, None)
+            except ClientError as e:
+                # Schema predates the trial_conditions fulltext index
+                logger.warning("Fulltext trial lookup unavailable, using scan: %s", e)
+                result = session.run(_INDICATION_GRAPH_QUERIES[(False, with_deals)], **params)
+                records = iter(result)
+                first = next(records, None)
             
-            if not record:
+            if first is None:
                 return {"nodes": [], "edges": []}
             
-            # Process trials
-            if include_trials:
-                for t in record.get("trials", []):
-                    if t and t["trial_id"] not in seen_nodes:
-                        seen_nodes.add(t["trial_id"])
-                        nodes.append({
-                            "id": t["trial_id"],
-                            "type": "trial",
-                            "label": t.get("title", t["trial_id"])[:50],
-                            "data": dict(t)
-                        })
-            
-            # Process assets
-            for a in record.get("assets", []):
-                if a and a["asset_id"] not in seen_nodes:
-                    seen_nodes.add(a["asset_id"])
-                    nodes.append({
+            for record in chain([first], records):
+                t = record["t"]
+                a = record["a"]
+                c = record["c"]
+                c2 = record["c2"]
+                d = record["d"] if with_deals else None
+                
+                # Nodes
+                if include_trials and t is not None and t["trial_id"] not in nodes:
+                    nodes[t["trial_id"]] = {
+                        "id": t["trial_id"],
+                        "type": "trial",
+                        "label": t.get("title", t["trial_id"])[:50],
+                        "data": t
+                    }
+                if a is not None and a["asset_id"] not in nodes:
+                    nodes[a["asset_id"]] = {
                         "id": a["asset_id"],
                         "type": "asset",
                         "label": a.get("name", a["asset_id"]),
-                        "data": dict(a)
-                    })
-            
-            # Process companies (sponsors and owners)
-            for c in record.get("companies", []) + record.get("owners", []):
-                if c and c["company_id"] not in seen_nodes:
-                    seen_nodes.add(c["company_id"])
-                    nodes.append({
-                        "id": c["company_id"],
-                        "type": "company",
-                        "label": c.get("name", c["company_id"]),
-                        "data": dict(c)
-                    })
-            
-            # Process deals
-            for d in record.get("deals", []):
-                if d and d["deal_id"] not in seen_nodes:
-                    seen_nodes.add(d["deal_id"])
-                    nodes.append({
+                        "data": a
+                    }
+                for comp in (c, c2):
+                    if comp is not None and comp["company_id"] not in nodes:
+                        nodes[comp["company_id"]] = {
+                            "id": comp["company_id"],
+                            "type": "company",
+                            "label": comp.get("name", comp["company_id"]),
+                            "data": comp
+                        }
+                if d is not None and d["deal_id"] not in nodes:
+                    nodes[d["deal_id"]] = {
                         "id": d["deal_id"],
                         "type": "deal",
                         "label": d.get("deal_type", "Deal"),
-                        "data": dict(d)
-                    })
-            
-            # Process sponsor relationships
-            for rel in record.get("sponsor_rels", []):
-                if rel["company"] and rel["trial"]:
-                    edge_id = f"{rel['company']['company_id']}-sponsors-{rel['trial']['trial_id']}"
-                    if edge_id not in seen_edges:
-                        seen_edges.add(edge_id)
-                        if include_trials:
-                            edges.append({
-                                "id": edge_id,
-                                "source": rel["company"]["company_id"],
-                                "target": rel["trial"]["trial_id"],
-                                "type": "SPONSORS_TRIAL",
-                                "label": rel.get("role", "sponsor"),
-                                "data": {"role": rel.get("role")}
-                            })
-            
-            # Process asset-trial relationships
-            for rel in record.get("asset_trial_rels", []):
-                if rel["asset"] and rel["trial"]:
-                    edge_id = f"{rel['asset']['asset_id']}-has_trial-{rel['trial']['trial_id']}"
-                    if edge_id not in seen_edges:
-                        seen_edges.add(edge_id)
-                        if include_trials:
-                            edges.append({
-                                "id": edge_id,
-                                "source": rel["asset"]["asset_id"],
-                                "target": rel["trial"]["trial_id"],
-                                "type": "HAS_TRIAL",
-                                "label": "trial",
-                                "data": {}
-                            })
-            
-            # Process ownership relationships
-            for rel in record.get("ownership_rels", []):
-                if rel["company"] and rel["asset"]:
-                    edge_id = f"{rel['company']['company_id']}-owns-{rel['asset']['asset_id']}"
-                    if edge_id not in seen_edges:
-                        seen_edges.add(edge_id)
-                        ownership = rel.get("ownership", {})
-                        edges.append({
+                        "data": d
+                    }
+                
+                # Edges
+                if include_trials and c is not None and t is not None:
+                    edge_id = f"{c['company_id']}-sponsors-{t['trial_id']}"
+                    if edge_id not in edges:
+                        edges[edge_id] = {
                             "id": edge_id,
-                            "source": rel["company"]["company_id"],
-                            "target": rel["asset"]["asset_id"],
+                            "source": c["company_id"],
+                            "target": t["trial_id"],
+                            "type": "SPONSORS_TRIAL",
+                            "label": record["sponsor_role"],
+                            "data": {"role": record["sponsor_role"]}
+                        }
+                if include_trials and a is not None and t is not None:
+                    edge_id = f"{a['asset_id']}-has_trial-{t['trial_id']}"
+                    if edge_id not in edges:
+                        edges[edge_id] = {
+                            "id": edge_id,
+                            "source": a["asset_id"],
+                            "target": t["trial_id"],
+                            "type": "HAS_TRIAL",
+                            "label": "trial",
+                            "data": {}
+                        }
+                if c2 is not None and a is not None:
+                    edge_id = f"{c2['company_id']}-owns-{a['asset_id']}"
+                    if edge_id not in edges:
+                        ownership = record["o"]
+                        edges[edge_id] = {
+                            "id": edge_id,
+                            "source": c2["company_id"],
+                            "target": a["asset_id"],
                             "type": "OWNS",
                             "label": "owns",
                             "data": {
                                 "confidence": ownership.get("confidence", 1.0) if ownership else 1.0,
                                 "source": ownership.get("source", "inferred") if ownership else "inferred"
                             }
-                        })
-            
-            # Process deal relationships
-            for rel in record.get("deal_party_rels", []):
-                if rel.get("company") and rel.get("deal"):
-                    edge_id = f"{rel['company']['company_id']}-party_to-{rel['deal']['deal_id']}"
-                    if edge_id not in seen_edges:
-                        seen_edges.add(edge_id)
-                        edges.append({
+                        }
+                if d is not None and c is not None:
+                    edge_id = f"{c['company_id']}-party_to-{d['deal_id']}"
+                    if edge_id not in edges:
+                        edges[edge_id] = {
                             "id": edge_id,
-                            "source": rel["company"]["company_id"],
-                            "target": rel["deal"]["deal_id"],
+                            "source": c["company_id"],
+                            "target": d["deal_id"],
                             "type": "PARTY_TO",
-                            "label": rel.get("role", "party"),
-                            "data": {"role": rel.get("role")}
-                        })
-            
-            for rel in record.get("deal_covers_rels", []):
-                if rel.get("deal") and rel.get("asset"):
-                    edge_id = f"{rel['deal']['deal_id']}-covers-{rel['asset']['asset_id']}"
-                    if edge_id not in seen_edges:
-                        seen_edges.add(edge_id)
-                        edges.append({
+                            "label": record["party_role"],
+                            "data": {"role": record["party_role"]}
+                        }
+                if d is not None and a is not None:
+                    edge_id = f"{d['deal_id']}-covers-{a['asset_id']}"
+                    if edge_id not in edges:
+                        edges[edge_id] = {
                             "id": edge_id,
-                            "source": rel["deal"]["deal_id"],
-                            "target": rel["asset"]["asset_id"],
+                            "source": d["deal_id"],
+                            "target": a["asset_id"],
                             "type": "COVERS",
                             "label": "covers",
                             "data": {}
-                        })
+                        }
         
-        return {"nodes": nodes, "edges": edges}
+        return {"nodes": list(nodes.values()), "edges": list(edges.values())}
     
     def get_landscape_stats(self, indication: str) -> Dict[str, Any]:
-        """Get landscape statistics for an indication."""
-        stats = {
-            "assets_by_phase": [],
-            "sponsors_by_trial_count": [],
-            "modalities": [],
-            "targets": [],
-            "total_trials": 0,
-            "total_assets": 0,
-            "total_companies": 0
-        }
-        
-        # Assets by phase
-        phase_query = """
-        MATCH (t:Trial)
-        WHERE any(cond IN t.conditions WHERE toLower(cond) CONTAINS toLower($indication))
-        WITH t.phase as phase, count(t) as count
-        RETURN phase, count ORDER BY count DESC
-        """
-        
-        # Sponsors by trial count
-        sponsor_query = """
-        MATCH (t:Trial)
-        WHERE any(cond IN t.conditions WHERE toLower(cond) CONTAINS toLower($indication))
-        MATCH (c:Company)-[:SPONSORS_TRIAL]->(t)
-        WITH c.name as sponsor, c.company_id as id, count(t) as trial_count
-        RETURN sponsor, id, trial_count ORDER BY trial_count DESC LIMIT 20
-        """
-        
-        # Modalities
-        modality_query = """
-        MATCH (t:Trial)
-        WHERE any(cond IN t.conditions WHERE toLower(cond) CONTAINS toLower($indication))
-        MATCH (a:Asset)-[:HAS_TRIAL]->(t)
-        WHERE a.modality IS NOT NULL
-        WITH a.modality as modality, count(DISTINCT a) as count
-        RETURN modality, count ORDER BY count DESC
-        """
-        
-        # Targets
-        target_query = """
-        MATCH (t:Trial)
-        WHERE any(cond IN t.conditions WHERE toLower(cond) CONTAINS toLower($indication))
-        MATCH (a:Asset)-[:HAS_TRIAL]->(t)
-        WHERE a.targets IS NOT NULL AND size(a.targets) > 0
-        UNWIND a.targets as target
-        WITH target, count(DISTINCT a) as count
-        RETURN target, count ORDER BY count DESC LIMIT 15
-        """
-        
-        # Totals
-        totals_query = """
-        MATCH (t:Trial)
-        WHERE any(cond IN t.conditions WHERE toLower(cond) CONTAINS toLower($indication))
-        OPTIONAL MATCH (a:Asset)-[:HAS_TRIAL]->(t)
-        OPTIONAL MATCH (c:Company)-[:SPONSORS_TRIAL]->(t)
-        RETURN count(DISTINCT t) as trials, count(DISTINCT a) as assets, count(DISTINCT c) as companies
-        """
-        
+        """Get landscape statistics for an indication (one fused query)."""
         with self.session() as session:
-            # Execute queries
-            for record in session.run(phase_query, indication=indication):
-                if record["phase"]:
-                    stats["assets_by_phase"].append({
-                        "phase": record["phase"],
-                        "count": record["count"]
-                    })
-            
-            for record in session.run(sponsor_query, indication=indication):
-                stats["sponsors_by_trial_count"].append({
-                    "sponsor": record["sponsor"],
-                    "id": record["id"],
-                    "trial_count": record["trial_count"]
-                })
-            
-            for record in session.run(modality_query, indication=indication):
-                stats["modalities"].append({
-                    "modality": record["modality"],
-                    "count": record["count"]
-                })
-            
-            for record in session.run(target_query, indication=indication):
-                stats["targets"].append({
-                    "target": record["target"],
-                    "count": record["count"]
-                })
-            
-            totals = session.run(totals_query, indication=indication).single()
-            if totals:
-                stats["total_trials"] = totals["trials"]
-                stats["total_assets"] = totals["assets"]
-                stats["total_companies"] = totals["companies"]
-        
-        return stats
+            try:
+                record = session.run(
+                    _LANDSCAPE_STATS_QUERIES[True], indication=indication
+                ).single()
+            except ClientError as e:
+                # Schema predates the trial_conditions fulltext index
+                logger.warning("Fulltext trial lookup unavailable, using scan: %s", e)
+                record = session.run(
+                    _LANDSCAPE_STATS_QUERIES[False], indication=indication
+                ).single()
+        if not record:
+            return {
+                "assets_by_phase": [],
+                "sponsors_by_trial_count": [],
+                "modalities": [],
+                "targets": [],
+                "total_trials": 0,
+                "total_assets": 0,
+                "total_companies": 0
+            }
+        return {
+            "assets_by_phase": record["phases"],
+            "sponsors_by_trial_count": record["sponsors"],
+            "modalities": record["modalities"],
+            "targets": record["targets"],
+            "total_trials": record["total_trials"],
+            "total_assets": record["total_assets"],
+            "total_companies": record["total_companies"]
+        }
     
     def clear_database(self):
         """Clear all data (for testing/reset)."""
         with self.session() as session:
             session.run("MATCH (n) DETACH DELETE n")
+            self._entity_cache.clear()
             logger.info("Database cleared")
 
 
@@ -4,6 +4,7 @@ Handles cleanup of intervention names and optional LLM enrichment.
 """
 import re
 import logging
+from functools import lru_cache
 from typing import Dict, Any, Optional, List
 
 from ..config import settings
@@ -109,6 +110,13 @@ COMPANY_NAME_ALIASES = {
     "novartis ag": "Novartis",
 }
 
+@lru_cache(maxsize=1 << 15)
+def _company_canonical(name: str) -> str:
+    """Memoized company-name canonicalization: the same sponsor names come
+    back for every trial they appear on, so lower+strip+lookup once."""
+    return COMPANY_NAME_ALIASES.get(name.lower().strip(), name)
+
+
 # Reverse lookup: alias -> canonical name
 ALIAS_TO_CANONICAL = {}
 for canonical, aliases in DRUG_ALIASES.items():
@@ -178,17 +186,31 @@ class NormalizationService:
     
     def __init__(self):
         self.llm_enabled = settings.llm_enrichment_enabled
-    
+        # Per-process memo tables: the same intervention names recur across
+        # trials, and normalization is pure regex/table work. Cached dicts are
+        # shared between callers — treat them as read-only.
+        self._intervention_cache: Dict[str, Optional[Dict[str, Any]]] = {}
+        self._known_data_cache: Dict[str, Dict[str, Any]] = {}
+
     def normalize_intervention(self, intervention: str) -> Optional[Dict[str, Any]]:
         """
         Normalize an intervention name.
-        
+
         Returns:
             Dict with normalized name and synonyms, or None if should be filtered
         """
         if not intervention:
             return None
-        
+
+        if intervention in self._intervention_cache:
+            return self._intervention_cache[intervention]
+        result = self._normalize_intervention_uncached(intervention)
+        if len(self._intervention_cache) < 8192:
+            self._intervention_cache[intervention] = result
+        return result
+
+    def _normalize_intervention_uncached(self, intervention: str) -> Optional[Dict[str, Any]]:
+
         # Trim and clean
         name = intervention.strip()
         
@@ -417,7 +439,7 @@ Return only valid JSON, no explanation."""
             return result
             
         except Exception as e:
-            logger.warning(f"LLM enrichment failed: {e}")
+            logger.warning("LLM enrichment failed: %s", e)
             return None
     
     def get_canonical_name(self, name: str) -> str:
@@ -503,19 +525,22 @@ Return only valid JSON, no explanation."""
     
     def normalize_company_name(self, name: str) -> str:
         """Normalize a company name to its canonical form."""
-        name_lower = name.lower().strip()
-        return COMPANY_NAME_ALIASES.get(name_lower, name)
+        return _company_canonical(name)
     
     def enrich_asset_with_known_data(self, drug_name: str) -> Dict[str, Any]:
         """
         Enrich asset with known drug owner data.
         
         Returns dict with modality, targets, fda_approved, brand_name if known.
+        Cached per drug name; callers must not mutate the returned dict.
         """
+        cached = self._known_data_cache.get(drug_name)
+        if cached is not None:
+            return cached
         canonical = self.get_canonical_name(drug_name).lower()
         drug_info = KNOWN_DRUG_OWNERS.get(canonical, {})
-        
-        return {
+
+        result = {
             "known_owner": drug_info.get("owner"),
             "modality": drug_info.get("modality"),
             "targets": drug_info.get("targets", []),
@@ -523,6 +548,9 @@ Return only valid JSON, no explanation."""
             "brand_name": drug_info.get("brand_name"),
             "is_generic": drug_info.get("is_generic", False),
         }
+        if len(self._known_data_cache) < 8192:
+            self._known_data_cache[drug_name] = result
+        return result
 
 
 # Singleton instance
@@ -4,10 +4,14 @@ Alternative to Neo4j for running without Docker.
 """
 import json
 import logging
+import msgspec
+import os
+import queue
 import re
 import sqlite3
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from contextlib import contextmanager
 from datetime import datetime, date
 
@@ -23,10 +27,66 @@ def json_serial(obj):
         return obj.isoformat()
     raise TypeError(f"Type {type(obj)} not serializable")
 
+
+# msgspec handles the JSON columns: it encodes the Evidence dataclasses,
+# tuples and datetimes directly in C, where stdlib json went through
+# model_dump() dicts and the json_serial fallback per value. Output stays
+# plain JSON text, interchangeable with rows written by older code.
+_json_encoder = msgspec.json.Encoder()
+_json_decoder = msgspec.json.Decoder()
+
+
+def _to_json(obj) -> str:
+    return _json_encoder.encode(obj).decode()
+
+
+def _from_json(text):
+    return _json_decoder.decode(text)
+
 # Database file location
 DB_PATH = Path(__file__).parent.parent.parent / "data" / "bdnetwork.db"
 
 
+_FTS_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def _fts_prefix_query(query_text: str) -> Optional[str]:
+    """Turn free text into a quoted FTS5 prefix query ("pembro"* matches
+    Pembrolizumab). Returns None when there is nothing to match."""
+    tokens = _FTS_TOKEN_RE.findall(query_text)
+    if not tokens:
+        return None
+    return " ".join(f'"{token}"*' for token in tokens)
+
+
+@lru_cache(maxsize=256)
+def _term_words(term: str) -> Tuple[str, ...]:
+    """Lowercased words of a search term, memoized (the same few terms recur on every graph/landscape query)."""
+    return tuple(w for w in term.lower().split() if w)
+
+
+@lru_cache(maxsize=64)
+def _indication_where(indication_terms: Tuple[str, ...], searchable_col: str) -> Tuple[str, Tuple[str, ...]]:
+    """Prepared WHERE fragment + LIKE params for an indication-terms tuple.
+
+    Matching is "all words in any term": for each term, every word must
+    appear in conditions_searchable. The configured term tuples recur on
+    every graph/landscape query, so both the string assembly and the
+    resulting stable SQL text (which keeps the connection statement cache
+    warm) are memoized here.
+    """
+    clauses = []
+    params: List[str] = []
+    for term in indication_terms:
+        words = _term_words(term)
+        if not words:
+            continue
+        clauses.append(" AND ".join([f"{searchable_col} LIKE ?" for _ in words]))
+        params.extend([f"%{w}%" for w in words])
+    where_sql = " OR ".join([f"({c})" for c in clauses]) if clauses else "1=0"
+    return where_sql, tuple(params)
+
+
 def _conditions_to_searchable(conditions: List[str]) -> str:
     """Normalize condition strings into one searchable string so variant phrasings match (e.g. 'Melanoma, Uveal' matches 'uveal melanoma')."""
     if not conditions:
@@ -40,22 +100,50 @@ class SQLiteService:
     """SQLite-based graph storage service."""
     
     def __init__(self, db_path: Optional[Path] = None):
-        """Initialize SQLite connection."""
+        """Initialize SQLite connection pool."""
         self.db_path = db_path or DB_PATH
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._pool_size = (os.cpu_count() or 2) * 2
+        self._pool: "queue.Queue[sqlite3.Connection]" = queue.Queue(maxsize=self._pool_size)
+        for _ in range(self._pool_size):
+            self._pool.put(self._create_connection())
         self._init_schema()
-        logger.info(f"SQLite database initialized at {self.db_path}")
-    
+        logger.info("SQLite database initialized at %s (pool size %s)", self.db_path, self._pool_size)
+
+    def _create_connection(self) -> sqlite3.Connection:
+        """Create a tuned connection for the pool."""
+        # cached_statements: sqlite3 reuses compiled plans keyed on SQL text;
+        # the default 128 is smaller than this module's set of distinct
+        # statements once the graph queries' IN-clause variants are counted.
+        conn = sqlite3.connect(
+            str(self.db_path), check_same_thread=False, cached_statements=256,
+            timeout=5.0
+        )
+        conn.row_factory = sqlite3.Row
+        # WAL lets readers run alongside a writer; the remaining pragmas trade
+        # crash-durability for fewer fsyncs and keep hot pages in memory.
+        # busy_timeout makes a writer that collides with an in-flight ingest
+        # transaction wait instead of failing with "database is locked".
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA busy_timeout=5000")
+        conn.execute("PRAGMA mmap_size=268435456")
+        conn.execute("PRAGMA cache_size=-65536")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        return conn
+
     @contextmanager
     def connection(self):
-        """Get a database connection context manager."""
-        conn = sqlite3.connect(str(self.db_path))
-        conn.row_factory = sqlite3.Row
+        """Borrow a pooled database connection; commits on success."""
+        conn = self._pool.get()
         try:
             yield conn
             conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
         finally:
-            conn.close()
+            self._pool.put(conn)
     
     def _init_schema(self):
         """Initialize database schema."""
@@ -268,6 +356,60 @@ class SQLiteService:
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_company_name ON companies(name)")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_asset_name ON assets(name)")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_trial_conditions ON trials(conditions)")
+            
+            # Full-text search: external-content FTS5 tables kept in sync by
+            # triggers so search_all can MATCH instead of LIKE-scanning every
+            # table. FTS5 can be compiled out of the linked SQLite, so failure
+            # here just leaves search on the LIKE fallback.
+            try:
+                self._init_fts(cursor)
+                self._fts_enabled = True
+            except sqlite3.OperationalError as e:
+                logger.warning("FTS5 unavailable, search will use LIKE scans: %s", e)
+                self._fts_enabled = False
+    
+    # (table, fts table, indexed columns) for each searchable node type
+    _FTS_TABLES = (
+        ("companies", "company_fts", ("name", "aliases")),
+        ("assets", "asset_fts", ("name", "synonyms")),
+        ("trials", "trial_fts", ("title", "trial_id")),
+    )
+
+    def _init_fts(self, cursor) -> None:
+        """Create the FTS5 tables, sync triggers, and backfill existing rows."""
+        for table, fts, columns in self._FTS_TABLES:
+            cols = ", ".join(columns)
+            new_cols = ", ".join(f"new.{c}" for c in columns)
+            old_cols = ", ".join(f"old.{c}" for c in columns)
+            cursor.execute(f"""
+                CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5(
+                    {cols}, content='{table}', content_rowid='rowid',
+                    tokenize='porter unicode61'
+                )
+            """)
+            cursor.execute(f"""
+                CREATE TRIGGER IF NOT EXISTS {table}_fts_ai AFTER INSERT ON {table} BEGIN
+                    INSERT INTO {fts}(rowid, {cols}) VALUES (new.rowid, {new_cols});
+                END
+            """)
+            cursor.execute(f"""
+                CREATE TRIGGER IF NOT EXISTS {table}_fts_ad AFTER DELETE ON {table} BEGIN
+                    INSERT INTO {fts}({fts}, rowid, {cols}) VALUES ('delete', old.rowid, {old_cols});
+                END
+            """)
+            cursor.execute(f"""
+                CREATE TRIGGER IF NOT EXISTS {table}_fts_au AFTER UPDATE ON {table} BEGIN
+                    INSERT INTO {fts}({fts}, rowid, {cols}) VALUES ('delete', old.rowid, {old_cols});
+                    INSERT INTO {fts}(rowid, {cols}) VALUES (new.rowid, {new_cols});
+                END
+            """)
+            # Backfill rows that predate the FTS tables (e.g. the seeded db).
+            # For external-content tables, selecting from the fts table reads
+            # the content table, so index size has to come from the internal
+            # docsize shadow table.
+            cursor.execute(f"SELECT (SELECT COUNT(*) FROM {fts}_docsize) = (SELECT COUNT(*) FROM {table})")
+            if not cursor.fetchone()[0]:
+                cursor.execute(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')")
     
     def init_schema(self):
         """Public method to initialize schema (for compatibility)."""
@@ -278,43 +420,48 @@ class SQLiteService:
     def upsert_company(self, company: Company) -> str:
         """Insert or update a Company."""
         with self.connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
+            self._upsert_company_cur(conn.cursor(), company)
+            return company.company_id
+
+    def _upsert_company_cur(self, cursor, company: Company) -> None:
+        cursor.execute("""
                 INSERT OR REPLACE INTO companies 
                 (company_id, name, aliases, country, public_flag, tickers, cik, status, company_type, evidence, updated_at)
                 VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
             """, (
                 company.company_id,
                 company.name,
-                json.dumps(company.aliases),
+                _to_json(company.aliases),
                 company.country,
                 1 if company.public_flag else 0 if company.public_flag is not None else None,
-                json.dumps(company.tickers),
+                _to_json(company.tickers),
                 company.cik,
                 company.status,
                 company.company_type,
-                json.dumps([e.model_dump() for e in company.evidence], default=json_serial),
+                _to_json(company.evidence),
                 datetime.utcnow().isoformat()
             ))
-            return company.company_id
     
     def upsert_asset(self, asset: Asset) -> str:
         """Insert or update an Asset. User overrides (modality/targets) are preserved and not overwritten by ingestion."""
         with self.connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("SELECT modality, targets FROM asset_user_overrides WHERE asset_id = ?", (asset.asset_id,))
-            override = cursor.fetchone()
-            modality = asset.modality
-            targets = asset.targets
-            if override:
-                if override["modality"] is not None:
-                    modality = override["modality"]
-                if override["targets"]:
-                    try:
-                        targets = json.loads(override["targets"])
-                    except (json.JSONDecodeError, TypeError):
-                        pass
-            cursor.execute("""
+            self._upsert_asset_cur(conn.cursor(), asset)
+            return asset.asset_id
+
+    def _upsert_asset_cur(self, cursor, asset: Asset) -> None:
+        cursor.execute("SELECT modality, targets FROM asset_user_overrides WHERE asset_id = ?", (asset.asset_id,))
+        override = cursor.fetchone()
+        modality = asset.modality
+        targets = asset.targets
+        if override:
+            if override["modality"] is not None:
+                modality = override["modality"]
+            if override["targets"]:
+                try:
+                    targets = json.loads(override["targets"])
+                except (json.JSONDecodeError, TypeError):
+                    pass
+        cursor.execute("""
                 INSERT OR REPLACE INTO assets
                 (asset_id, name, synonyms, modality, targets, indications, stage_current, 
                  modality_confidence, targets_confidence, evidence, updated_at)
@@ -322,25 +469,27 @@ class SQLiteService:
             """, (
                 asset.asset_id,
                 asset.name,
-                json.dumps(asset.synonyms),
+                _to_json(asset.synonyms),
                 modality,
                 json.dumps(targets),
-                json.dumps(asset.indications),
+                _to_json(asset.indications),
                 asset.stage_current,
                 asset.modality_confidence,
                 asset.targets_confidence,
-                json.dumps([e.model_dump() for e in asset.evidence], default=json_serial),
+                _to_json(asset.evidence),
                 datetime.utcnow().isoformat()
             ))
-            return asset.asset_id
     
     def upsert_trial(self, trial: Trial) -> str:
         """Insert or update a Trial."""
-        conditions_json = json.dumps(trial.conditions)
-        conditions_searchable = _conditions_to_searchable(trial.conditions or [])
         with self.connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
+            self._upsert_trial_cur(conn.cursor(), trial)
+            return trial.trial_id
+
+    def _upsert_trial_cur(self, cursor, trial: Trial) -> None:
+        conditions_json = _to_json(trial.conditions)
+        conditions_searchable = _conditions_to_searchable(trial.conditions or [])
+        cursor.execute("""
                 INSERT OR REPLACE INTO trials
                 (trial_id, title, phase, status, start_date, completion_date, interventions,
                  conditions, conditions_searchable, sponsors, collaborators, enrollment, study_type, brief_summary,
@@ -353,25 +502,27 @@ class SQLiteService:
                 trial.status,
                 str(trial.start_date) if trial.start_date else None,
                 str(trial.completion_date) if trial.completion_date else None,
-                json.dumps(trial.interventions),
+                _to_json(trial.interventions),
                 conditions_json,
                 conditions_searchable,
-                json.dumps(trial.sponsors),
-                json.dumps(trial.collaborators),
+                _to_json(trial.sponsors),
+                _to_json(trial.collaborators),
                 trial.enrollment,
                 trial.study_type,
                 trial.brief_summary,
                 trial.source_url,
-                json.dumps([e.model_dump() for e in trial.evidence], default=json_serial),
+                _to_json(trial.evidence),
                 datetime.utcnow().isoformat()
             ))
-            return trial.trial_id
     
     def upsert_document(self, doc: Document) -> str:
         """Insert or update a Document."""
         with self.connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
+            self._upsert_document_cur(conn.cursor(), doc)
+            return doc.doc_id
+
+    def _upsert_document_cur(self, cursor, doc: Document) -> None:
+        cursor.execute("""
                 INSERT OR REPLACE INTO documents
                 (doc_id, doc_type, publisher, url, published_at, retrieved_at, text_hash, updated_at)
                 VALUES (?, ?, ?, ?, ?, ?, ?, ?)
@@ -385,7 +536,6 @@ class SQLiteService:
                 doc.text_hash,
                 datetime.utcnow().isoformat()
             ))
-            return doc.doc_id
     
     def upsert_deal(self, deal: Deal) -> str:
         """Insert or update a Deal."""
@@ -402,7 +552,7 @@ class SQLiteService:
                 deal.summary,
                 deal.status,
                 deal.value_usd,
-                json.dumps([e.model_dump() for e in deal.evidence], default=json_serial),
+                _to_json(deal.evidence),
                 datetime.utcnow().isoformat()
             ))
             return deal.deal_id
@@ -412,75 +562,81 @@ class SQLiteService:
     def create_sponsors_trial(self, rel: SponsorsTrial):
         """Create SPONSORS_TRIAL relationship."""
         with self.connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
+            self._create_sponsors_trial_cur(conn.cursor(), rel)
+
+    def _create_sponsors_trial_cur(self, cursor, rel: SponsorsTrial) -> None:
+        cursor.execute("""
                 INSERT OR REPLACE INTO sponsors_trial (company_id, trial_id, role, evidence)
                 VALUES (?, ?, ?, ?)
             """, (
                 rel.company_id,
                 rel.trial_id,
                 rel.role,
-                json.dumps([e.model_dump() for e in rel.evidence], default=json_serial)
+                _to_json(rel.evidence)
             ))
     
     def create_has_trial(self, rel: HasTrial):
         """Create HAS_TRIAL relationship."""
         with self.connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
+            self._create_has_trial_cur(conn.cursor(), rel)
+
+    def _create_has_trial_cur(self, cursor, rel: HasTrial) -> None:
+        cursor.execute("""
                 INSERT OR REPLACE INTO has_trial (asset_id, trial_id, evidence)
                 VALUES (?, ?, ?)
             """, (
                 rel.asset_id,
                 rel.trial_id,
-                json.dumps([e.model_dump() for e in rel.evidence], default=json_serial)
+                _to_json(rel.evidence)
             ))
     
     def create_owns(self, rel: Owns, user_confirmed: bool = False):
         """Create or update OWNS relationship. If user_confirmed=True, preserves existing user_confirmed=1."""
         with self.connection() as conn:
-            cursor = conn.cursor()
-            if user_confirmed:
-                cursor.execute("""
-                    INSERT INTO owns 
-                    (company_id, asset_id, from_date, to_date, confidence, source, is_current, evidence, user_confirmed)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, 1)
-                    ON CONFLICT(company_id, asset_id) DO UPDATE SET
-                    confidence = excluded.confidence,
-                    source = excluded.source,
-                    user_confirmed = 1,
-                    evidence = excluded.evidence
-                """, (
-                    rel.company_id,
-                    rel.asset_id,
-                    str(rel.from_date) if rel.from_date else None,
-                    str(rel.to_date) if rel.to_date else None,
-                    rel.confidence,
-                    rel.source,
-                    1 if rel.is_current else 0,
-                    json.dumps([e.model_dump() for e in rel.evidence], default=json_serial)
-                ))
-            else:
-                # Do not overwrite if existing row has user_confirmed=1
-                cursor.execute("SELECT user_confirmed FROM owns WHERE company_id = ? AND asset_id = ?",
-                               (rel.company_id, rel.asset_id))
-                row = cursor.fetchone()
-                if row and row[0]:
-                    return  # Skip overwriting user-confirmed ownership
-                cursor.execute("""
-                    INSERT OR REPLACE INTO owns 
-                    (company_id, asset_id, from_date, to_date, confidence, source, is_current, evidence, user_confirmed)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, 0)
-                """, (
-                    rel.company_id,
-                    rel.asset_id,
-                    str(rel.from_date) if rel.from_date else None,
-                    str(rel.to_date) if rel.to_date else None,
-                    rel.confidence,
-                    rel.source,
-                    1 if rel.is_current else 0,
-                    json.dumps([e.model_dump() for e in rel.evidence], default=json_serial)
-                ))
+            self._create_owns_cur(conn.cursor(), rel, user_confirmed)
+
+    def _create_owns_cur(self, cursor, rel: Owns, user_confirmed: bool = False) -> None:
+        if user_confirmed:
+            cursor.execute("""
+                INSERT INTO owns 
+                (company_id, asset_id, from_date, to_date, confidence, source, is_current, evidence, user_confirmed)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, 1)
+                ON CONFLICT(company_id, asset_id) DO UPDATE SET
+                confidence = excluded.confidence,
+                source = excluded.source,
+                user_confirmed = 1,
+                evidence = excluded.evidence
+            """, (
+                rel.company_id,
+                rel.asset_id,
+                str(rel.from_date) if rel.from_date else None,
+                str(rel.to_date) if rel.to_date else None,
+                rel.confidence,
+                rel.source,
+                1 if rel.is_current else 0,
+                _to_json(rel.evidence)
+            ))
+        else:
+            # Do not overwrite if existing row has user_confirmed=1
+            cursor.execute("SELECT user_confirmed FROM owns WHERE company_id = ? AND asset_id = ?",
+                           (rel.company_id, rel.asset_id))
+            row = cursor.fetchone()
+            if row and row[0]:
+                return  # Skip overwriting user-confirmed ownership
+            cursor.execute("""
+                INSERT OR REPLACE INTO owns 
+                (company_id, asset_id, from_date, to_date, confidence, source, is_current, evidence, user_confirmed)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, 0)
+            """, (
+                rel.company_id,
+                rel.asset_id,
+                str(rel.from_date) if rel.from_date else None,
+                str(rel.to_date) if rel.to_date else None,
+                rel.confidence,
+                rel.source,
+                1 if rel.is_current else 0,
+                _to_json(rel.evidence)
+            ))
 
     def _clear_company_asset_relationships(self, company_id: str, asset_id: str, cursor) -> None:
         """Remove all existing relationships between a company and asset (used before setting a new one)."""
@@ -491,72 +647,78 @@ class SQLiteService:
     def upsert_owns_user_confirmed(self, company_id: str, asset_id: str, confidence: float = 1.0) -> None:
         """Set or confirm ownership of an asset by a company. Replaces any other relationship types."""
         with self.connection() as conn:
-            cursor = conn.cursor()
-            # Remove any other relationship types first
-            self._clear_company_asset_relationships(company_id, asset_id, cursor)
-            
-            rel = Owns(
-                company_id=company_id,
-                asset_id=asset_id,
-                confidence=confidence,
-                source="user_confirmed",
-                is_current=True,
-                evidence=[EdgeEvidence(source_type="user_confirmed", confidence=confidence)]
-            )
-            cursor.execute("""
-                INSERT INTO owns (company_id, asset_id, from_date, to_date, confidence, source, is_current, evidence, user_confirmed)
-                VALUES (?, ?, ?, ?, ?, ?, 1, ?, 1)
-                ON CONFLICT(company_id, asset_id) DO UPDATE SET confidence = ?, source = 'user_confirmed', user_confirmed = 1, evidence = ?
-            """, (
-                rel.company_id,
-                rel.asset_id,
-                None,
-                None,
-                rel.confidence,
-                rel.source,
-                json.dumps([e.model_dump() for e in rel.evidence], default=json_serial),
-                rel.confidence,
-                json.dumps([e.model_dump() for e in rel.evidence], default=json_serial)
-            ))
+            self._upsert_owns_user_confirmed_cur(conn.cursor(), company_id, asset_id, confidence)
+
+    def _upsert_owns_user_confirmed_cur(self, cursor, company_id: str, asset_id: str, confidence: float = 1.0) -> None:
+        # Remove any other relationship types first
+        self._clear_company_asset_relationships(company_id, asset_id, cursor)
+        
+        rel = Owns(
+            company_id=company_id,
+            asset_id=asset_id,
+            confidence=confidence,
+            source="user_confirmed",
+            is_current=True,
+            evidence=[EdgeEvidence(source_type="user_confirmed", confidence=confidence)]
+        )
+        cursor.execute("""
+            INSERT INTO owns (company_id, asset_id, from_date, to_date, confidence, source, is_current, evidence, user_confirmed)
+            VALUES (?, ?, ?, ?, ?, ?, 1, ?, 1)
+            ON CONFLICT(company_id, asset_id) DO UPDATE SET confidence = ?, source = 'user_confirmed', user_confirmed = 1, evidence = ?
+        """, (
+            rel.company_id,
+            rel.asset_id,
+            None,
+            None,
+            rel.confidence,
+            rel.source,
+            _to_json(rel.evidence),
+            rel.confidence,
+            _to_json(rel.evidence)
+        ))
 
     def upsert_licenses_user_confirmed(self, company_id: str, asset_id: str, confidence: float = 1.0) -> None:
         """Set a license relationship. Replaces any other relationship types."""
         with self.connection() as conn:
-            cursor = conn.cursor()
-            # Remove any other relationship types first
-            self._clear_company_asset_relationships(company_id, asset_id, cursor)
-            
-            cursor.execute("""
-                INSERT INTO licenses (company_id, asset_id, from_date, to_date, territory, confidence, source, evidence)
-                VALUES (?, ?, NULL, NULL, NULL, ?, 'user_confirmed', ?)
-                ON CONFLICT(company_id, asset_id) DO UPDATE SET confidence = ?, source = 'user_confirmed', evidence = ?
-            """, (
-                company_id,
-                asset_id,
-                confidence,
-                json.dumps([{"source_type": "user_confirmed", "confidence": confidence}]),
-                confidence,
-                json.dumps([{"source_type": "user_confirmed", "confidence": confidence}])
-            ))
+            self._upsert_licenses_user_confirmed_cur(conn.cursor(), company_id, asset_id, confidence)
+
+    def _upsert_licenses_user_confirmed_cur(self, cursor, company_id: str, asset_id: str, confidence: float = 1.0) -> None:
+        # Remove any other relationship types first
+        self._clear_company_asset_relationships(company_id, asset_id, cursor)
+        
+        cursor.execute("""
+            INSERT INTO licenses (company_id, asset_id, from_date, to_date, territory, confidence, source, evidence)
+            VALUES (?, ?, NULL, NULL, NULL, ?, 'user_confirmed', ?)
+            ON CONFLICT(company_id, asset_id) DO UPDATE SET confidence = ?, source = 'user_confirmed', evidence = ?
+        """, (
+            company_id,
+            asset_id,
+            confidence,
+            json.dumps([{"source_type": "user_confirmed", "confidence": confidence}]),
+            confidence,
+            json.dumps([{"source_type": "user_confirmed", "confidence": confidence}])
+        ))
 
     def upsert_uses_as_comparator_user_confirmed(self, company_id: str, asset_id: str, trial_id: str = "user_set") -> None:
         """Set a uses_as_comparator relationship. Replaces any other relationship types."""
         with self.connection() as conn:
-            cursor = conn.cursor()
-            # Remove any other relationship types first
-            self._clear_company_asset_relationships(company_id, asset_id, cursor)
-            
-            cursor.execute("""
-                INSERT INTO uses_as_comparator (company_id, asset_id, trial_id, evidence)
-                VALUES (?, ?, ?, ?)
-                ON CONFLICT(company_id, asset_id, trial_id) DO UPDATE SET evidence = ?
-            """, (
-                company_id,
-                asset_id,
-                trial_id,
-                json.dumps([{"source_type": "user_confirmed", "confidence": 1.0}]),
-                json.dumps([{"source_type": "user_confirmed", "confidence": 1.0}])
-            ))
+            self._upsert_uses_as_comparator_user_confirmed_cur(conn.cursor(), company_id, asset_id, trial_id)
+
+    def _upsert_uses_as_comparator_user_confirmed_cur(self, cursor, company_id: str, asset_id: str, trial_id: str = "user_set") -> None:
+        # Remove any other relationship types first
+        self._clear_company_asset_relationships(company_id, asset_id, cursor)
+        
+        cursor.execute("""
+            INSERT INTO uses_as_comparator (company_id, asset_id, trial_id, evidence)
+            VALUES (?, ?, ?, ?)
+            ON CONFLICT(company_id, asset_id, trial_id) DO UPDATE SET evidence = ?
+        """, (
+            company_id,
+            asset_id,
+            trial_id,
+            json.dumps([{"source_type": "user_confirmed", "confidence": 1.0}]),
+            json.dumps([{"source_type": "user_confirmed", "confidence": 1.0}])
+        ))
     
     def create_party_to(self, rel: PartyTo):
         """Create PARTY_TO relationship."""
@@ -569,7 +731,7 @@ class SQLiteService:
                 rel.company_id,
                 rel.deal_id,
                 rel.role,
-                json.dumps([e.model_dump() for e in rel.evidence], default=json_serial)
+                _to_json(rel.evidence)
             ))
     
     def create_covers(self, rel: Covers):
@@ -582,21 +744,23 @@ class SQLiteService:
             """, (
                 rel.deal_id,
                 rel.asset_id,
-                json.dumps([e.model_dump() for e in rel.evidence], default=json_serial)
+                _to_json(rel.evidence)
             ))
     
     def create_participates_in_trial(self, rel: ParticipatesInTrial):
         """Create PARTICIPATES_IN_TRIAL relationship (for sites, investigators, academic centers)."""
         with self.connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
+            self._create_participates_in_trial_cur(conn.cursor(), rel)
+
+    def _create_participates_in_trial_cur(self, cursor, rel: ParticipatesInTrial) -> None:
+        cursor.execute("""
                 INSERT OR REPLACE INTO participates_in_trial (company_id, trial_id, role, evidence)
                 VALUES (?, ?, ?, ?)
             """, (
                 rel.company_id,
                 rel.trial_id,
                 rel.role,
-                json.dumps([e.model_dump() for e in rel.evidence], default=json_serial)
+                _to_json(rel.evidence)
             ))
     
     def create_licenses(self, rel: Licenses):
@@ -615,23 +779,93 @@ class SQLiteService:
                 rel.territory,
                 rel.confidence,
                 rel.source,
-                json.dumps([e.model_dump() for e in rel.evidence], default=json_serial)
+                _to_json(rel.evidence)
             ))
     
     def create_uses_as_comparator(self, rel: UsesAsComparator):
         """Create USES_AS_COMPARATOR relationship (for comparator drugs in trials)."""
         with self.connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
+            self._create_uses_as_comparator_cur(conn.cursor(), rel)
+
+    def _create_uses_as_comparator_cur(self, cursor, rel: UsesAsComparator) -> None:
+        cursor.execute("""
                 INSERT OR REPLACE INTO uses_as_comparator (company_id, asset_id, trial_id, evidence)
                 VALUES (?, ?, ?, ?)
             """, (
                 rel.company_id,
                 rel.asset_id,
                 rel.trial_id,
-                json.dumps([e.model_dump() for e in rel.evidence], default=json_serial)
+                _to_json(rel.evidence)
             ))
     
+    # ==================== Bulk Operations ====================
+    # The per-entity methods above pay one pool borrow and one WAL commit
+    # each; during ingestion that commit cost dominates wall time. The bulk
+    # variants write a whole batch on one connection in one transaction.
+
+    def upsert_companies_bulk(self, companies: List[Company]) -> None:
+        """Insert or update a batch of Companies in one transaction."""
+        with self.connection() as conn:
+            cursor = conn.cursor()
+            for company in companies:
+                self._upsert_company_cur(cursor, company)
+
+    def upsert_assets_bulk(self, assets: List[Asset]) -> None:
+        """Insert or update a batch of Assets in one transaction."""
+        with self.connection() as conn:
+            cursor = conn.cursor()
+            for asset in assets:
+                self._upsert_asset_cur(cursor, asset)
+
+    def upsert_trials_bulk(self, trials: List[Trial]) -> None:
+        """Insert or update a batch of Trials in one transaction."""
+        with self.connection() as conn:
+            cursor = conn.cursor()
+            for trial in trials:
+                self._upsert_trial_cur(cursor, trial)
+
+    def upsert_documents_bulk(self, docs: List[Document]) -> None:
+        """Insert or update a batch of Documents in one transaction."""
+        with self.connection() as conn:
+            cursor = conn.cursor()
+            for doc in docs:
+                self._upsert_document_cur(cursor, doc)
+
+    def create_sponsors_trial_bulk(self, rels: List[SponsorsTrial]) -> None:
+        """Create a batch of SPONSORS_TRIAL relationships in one transaction."""
+        with self.connection() as conn:
+            cursor = conn.cursor()
+            for rel in rels:
+                self._create_sponsors_trial_cur(cursor, rel)
+
+    def create_participates_in_trial_bulk(self, rels: List[ParticipatesInTrial]) -> None:
+        """Create a batch of PARTICIPATES_IN_TRIAL relationships in one transaction."""
+        with self.connection() as conn:
+            cursor = conn.cursor()
+            for rel in rels:
+                self._create_participates_in_trial_cur(cursor, rel)
+
+    def create_has_trial_bulk(self, rels: List[HasTrial]) -> None:
+        """Create a batch of HAS_TRIAL relationships in one transaction."""
+        with self.connection() as conn:
+            cursor = conn.cursor()
+            for rel in rels:
+                self._create_has_trial_cur(cursor, rel)
+
+    def create_owns_bulk(self, rels: List[Owns]) -> None:
+        """Create a batch of OWNS relationships in one transaction (ingestion path; user-confirmed rows are preserved)."""
+        with self.connection() as conn:
+            cursor = conn.cursor()
+            for rel in rels:
+                self._create_owns_cur(cursor, rel)
+
+    def create_uses_as_comparator_bulk(self, rels: List[UsesAsComparator]) -> None:
+        """Create a batch of USES_AS_COMPARATOR relationships in one transaction."""
+        with self.connection() as conn:
+            cursor = conn.cursor()
+            for rel in rels:
+                self._create_uses_as_comparator_cur(cursor, rel)
+
     # ==================== Query Operations ====================
     
     def _row_to_dict(self, row) -> Dict[str, Any]:
@@ -644,8 +878,8 @@ class SQLiteService:
                     'conditions', 'sponsors', 'collaborators', 'tickers', 'evidence']:
             if key in d and d[key]:
                 try:
-                    d[key] = json.loads(d[key])
-                except (json.JSONDecodeError, TypeError):
+                    d[key] = _from_json(d[key])
+                except (msgspec.DecodeError, TypeError):
                     pass
         return d
     
@@ -707,19 +941,43 @@ class SQLiteService:
 
     def set_asset_override(self, asset_id: str, modality: Optional[str] = None, targets: Optional[List[str]] = None) -> None:
         """Set user override for asset modality/targets. ClinicalTrials.gov ingestion will not overwrite these."""
+        with self.connection() as conn:
+            self._set_asset_override_cur(conn.cursor(), asset_id, modality, targets)
+
+    def _set_asset_override_cur(self, cursor, asset_id: str, modality: Optional[str] = None, targets: Optional[List[str]] = None) -> None:
+        cursor.execute("SELECT modality, targets FROM asset_user_overrides WHERE asset_id = ?", (asset_id,))
+        r = cursor.fetchone()
+        cur_mod = r["modality"] if r else None
+        cur_tgt = json.loads(r["targets"]) if r and r["targets"] else []
+        final_mod = modality if modality is not None else cur_mod
+        final_tgt = targets if targets is not None else cur_tgt
+        cursor.execute("""
+            INSERT INTO asset_user_overrides (asset_id, modality, targets, updated_at)
+            VALUES (?, ?, ?, ?)
+            ON CONFLICT(asset_id) DO UPDATE SET modality = ?, targets = ?, updated_at = ?
+        """, (asset_id, final_mod, json.dumps(final_tgt), datetime.utcnow().isoformat(), final_mod, json.dumps(final_tgt), datetime.utcnow().isoformat()))
+
+    def apply_asset_update(
+        self,
+        asset_id: str,
+        modality: Optional[str] = None,
+        targets: Optional[List[str]] = None,
+        owner_company_id: Optional[str] = None,
+        relationship_type: str = "owns",
+    ) -> None:
+        """Apply a user asset update (overrides and/or one relationship) in a single transaction."""
         with self.connection() as conn:
             cursor = conn.cursor()
-            cursor.execute("SELECT modality, targets FROM asset_user_overrides WHERE asset_id = ?", (asset_id,))
-            r = cursor.fetchone()
-            cur_mod = r["modality"] if r else None
-            cur_tgt = json.loads(r["targets"]) if r and r["targets"] else []
-            final_mod = modality if modality is not None else cur_mod
-            final_tgt = targets if targets is not None else cur_tgt
-            cursor.execute("""
-                INSERT INTO asset_user_overrides (asset_id, modality, targets, updated_at)
-                VALUES (?, ?, ?, ?)
-                ON CONFLICT(asset_id) DO UPDATE SET modality = ?, targets = ?, updated_at = ?
-            """, (asset_id, final_mod, json.dumps(final_tgt), datetime.utcnow().isoformat(), final_mod, json.dumps(final_tgt), datetime.utcnow().isoformat()))
+            if modality is not None or targets is not None:
+                self._set_asset_override_cur(cursor, asset_id, modality, targets)
+            if owner_company_id is not None:
+                if relationship_type == "owns":
+                    self._upsert_owns_user_confirmed_cur(cursor, owner_company_id, asset_id, 1.0)
+                elif relationship_type == "licenses":
+                    self._upsert_licenses_user_confirmed_cur(cursor, owner_company_id, asset_id, 1.0)
+                elif relationship_type == "uses_as_comparator":
+                    # For comparator, user-set relationships use a placeholder trial
+                    self._upsert_uses_as_comparator_user_confirmed_cur(cursor, owner_company_id, asset_id)
 
     def get_asset(self, asset_id: str) -> Optional[Dict[str, Any]]:
         """Get an asset by ID with related data. Merges user overrides for modality/targets."""
@@ -891,7 +1149,33 @@ class SQLiteService:
             return trial
     
     def search_all(self, query_text: str, limit: int = 20) -> Dict[str, List[Dict]]:
-        """Search across all node types."""
+        """Search across all node types. Uses the FTS5 index when present."""
+        if getattr(self, "_fts_enabled", False):
+            match = _fts_prefix_query(query_text)
+            if match:
+                try:
+                    return self._search_all_fts(match, limit)
+                except sqlite3.OperationalError:
+                    pass  # malformed MATCH or missing table - fall through to LIKE
+        return self._search_all_like(query_text, limit)
+
+    def _search_all_fts(self, match: str, limit: int) -> Dict[str, List[Dict]]:
+        """MATCH each node type's FTS table, best-ranked rows first."""
+        results = {}
+        with self.connection() as conn:
+            cursor = conn.cursor()
+            for key, (table, fts, _) in zip(("companies", "assets", "trials"), self._FTS_TABLES):
+                cursor.execute(f"""
+                    SELECT t.*, 1.0 as score
+                    FROM {fts} JOIN {table} t ON t.rowid = {fts}.rowid
+                    WHERE {fts} MATCH ?
+                    ORDER BY rank LIMIT ?
+                """, (match, limit))
+                results[key] = [self._row_to_dict(row) for row in cursor.fetchall()]
+        return results
+
+    def _search_all_like(self, query_text: str, limit: int = 20) -> Dict[str, List[Dict]]:
+        """LIKE-scan fallback when FTS5 is unavailable."""
         results = {"companies": [], "assets": [], "trials": []}
         query_pattern = f"%{query_text}%"
         
@@ -924,6 +1208,27 @@ class SQLiteService:
         
         return results
     
+    def _batched_in_query(
+        self,
+        cursor,
+        sql_template: str,
+        ids: List[str],
+        group_key: str
+    ) -> Dict[str, List[sqlite3.Row]]:
+        """
+        Run an IN-clause query in chunks (SQLite's parameter limit) and group the
+        rows by group_key. Replaces per-row follow-up queries with one round-trip
+        per relationship type.
+        """
+        grouped: Dict[str, List[sqlite3.Row]] = {}
+        for start in range(0, len(ids), 900):
+            chunk = ids[start:start + 900]
+            placeholders = ",".join("?" for _ in chunk)
+            cursor.execute(sql_template.format(placeholders=placeholders), chunk)
+            for row in cursor.fetchall():
+                grouped.setdefault(row[group_key], []).append(row)
+        return grouped
+
     def _trial_matches_status_filter(self, trial: Dict[str, Any], trial_filter: str) -> bool:
         """Return True if trial should be included for the given trial_filter."""
         if trial_filter == "none":
@@ -949,7 +1254,18 @@ class SQLiteService:
         trial_filter: Optional[str] = None,
         limit: int = 500
     ) -> Dict[str, Any]:
-        """Get the network graph for an indication. trial_filter: none, recruiting, active_not_recruiting, all."""
+        """Get the network graph for an indication. trial_filter: none, recruiting, active_not_recruiting, all.
+
+        Graph assembly is deliberately set-oriented: trials are selected in
+        one query and their assets/sponsors/participants fetched in batched
+        IN-clause queries, so the joins run inside SQLite rather than as
+        Python loops over node objects.
+        """
+        # No usable search words means the WHERE clause can never match;
+        # skip the round-trip entirely instead of running a 1=0 query.
+        if not any(_term_words(term) for term in indication_terms):
+            return {"nodes": [], "edges": []}
+
         nodes = []
         edges = []
         seen_nodes = set()
@@ -962,19 +1278,13 @@ class SQLiteService:
 
         with self.connection() as conn:
             cursor = conn.cursor()
-            # Match if any indication term matches: for each term, all words in the term must appear in conditions_searchable
-            # (so "Melanoma, Uveal" matches term "uveal melanoma" without adding config for every variant)
-            searchable_col = "LOWER(COALESCE(conditions_searchable, ''))"
-            term_clauses = []
-            term_params: List[str] = []
-            for term in indication_terms:
-                words = [w for w in term.lower().split() if w]
-                if not words:
-                    continue
-                term_clauses.append(" AND ".join([f"{searchable_col} LIKE ?" for _ in words]))
-                term_params.extend([f"%{w}%" for w in words])
-            where_sql = " OR ".join([f"({c})" for c in term_clauses]) if term_clauses else "1=0"
-            term_params.append(limit)
+            # Matching semantics documented on _indication_where (so
+            # "Melanoma, Uveal" matches term "uveal melanoma" without adding
+            # config for every variant)
+            where_sql, like_params = _indication_where(
+                tuple(indication_terms), "LOWER(COALESCE(conditions_searchable, ''))"
+            )
+            term_params: List[Any] = [*like_params, limit]
             # Find trials matching any indication term
             cursor.execute(f"""
                 SELECT * FROM trials
@@ -983,18 +1293,57 @@ class SQLiteService:
             """, term_params)
             
             trial_rows = cursor.fetchall()
-            
+
+            # Apply the phase filter up front; all batched lookups below are
+            # keyed off the surviving trials
+            trials = []
             for trial_row in trial_rows:
                 trial = self._row_to_dict(trial_row)
-                trial_id = trial['trial_id']
-                
-                # Apply phase filter
                 if phase_filter and trial.get('phase') not in phase_filter:
                     continue
-                
+                trials.append(trial)
+            trial_ids = [t['trial_id'] for t in trials]
+
+            # Batch the per-trial follow-up lookups into one IN query per
+            # relationship type instead of 5+ queries per trial (N+1 pattern)
+            participants_by_trial = self._batched_in_query(cursor, """
+                SELECT c.*, pit.role, pit.trial_id AS _trial_id
+                FROM companies c
+                JOIN participates_in_trial pit ON c.company_id = pit.company_id
+                WHERE pit.trial_id IN ({placeholders})
+            """, trial_ids, '_trial_id')
+            sponsors_by_trial = self._batched_in_query(cursor, """
+                SELECT c.*, st.role, st.trial_id AS _trial_id
+                FROM companies c
+                JOIN sponsors_trial st ON c.company_id = st.company_id
+                WHERE st.trial_id IN ({placeholders})
+            """, trial_ids, '_trial_id')
+            assets_by_trial = self._batched_in_query(cursor, """
+                SELECT a.*, ht.trial_id AS _trial_id
+                FROM assets a
+                JOIN has_trial ht ON a.asset_id = ht.asset_id
+                WHERE ht.trial_id IN ({placeholders})
+            """, trial_ids, '_trial_id')
+            all_asset_ids = []
+            seen_asset_ids = set()
+            for rows in assets_by_trial.values():
+                for row in rows:
+                    if row['asset_id'] not in seen_asset_ids:
+                        seen_asset_ids.add(row['asset_id'])
+                        all_asset_ids.append(row['asset_id'])
+            owners_by_asset = self._batched_in_query(cursor, """
+                SELECT c.*, o.confidence, o.source, o.asset_id AS _asset_id
+                FROM companies c
+                JOIN owns o ON c.company_id = o.company_id
+                WHERE o.asset_id IN ({placeholders})
+            """, all_asset_ids, '_asset_id')
+
+            for trial in trials:
+                trial_id = trial['trial_id']
+
                 # Include this trial node/edges only if it matches the status filter
                 trial_in_scope = show_trials and (not trial_filter or trial_filter == "all" or self._trial_matches_status_filter(trial, trial_filter))
-                
+
                 # Add trial node if including trials and trial matches filter
                 if trial_in_scope and trial_id not in seen_nodes:
                     seen_nodes.add(trial_id)
@@ -1004,17 +1353,11 @@ class SQLiteService:
                         "label": trial.get('title', trial_id)[:50],
                         "data": trial
                     })
-                
-                # Get sites/investigators participating in this trial (non-industry)
-                cursor.execute("""
-                    SELECT c.*, pit.role
-                    FROM companies c
-                    JOIN participates_in_trial pit ON c.company_id = pit.company_id
-                    WHERE pit.trial_id = ?
-                """, (trial_id,))
-                
-                for company_row in cursor.fetchall():
+
+                # Sites/investigators participating in this trial (non-industry)
+                for company_row in participants_by_trial.get(trial_id, []):
                     company = self._row_to_dict(company_row)
+                    company.pop('_trial_id', None)
                     company_id = company['company_id']
                     
                     if company_id not in seen_nodes:
@@ -1040,15 +1383,9 @@ class SQLiteService:
                             })
                 
                 # Also check old sponsors_trial for backwards compatibility during migration
-                cursor.execute("""
-                    SELECT c.*, st.role
-                    FROM companies c
-                    JOIN sponsors_trial st ON c.company_id = st.company_id
-                    WHERE st.trial_id = ?
-                """, (trial_id,))
-                
-                for company_row in cursor.fetchall():
+                for company_row in sponsors_by_trial.get(trial_id, []):
                     company = self._row_to_dict(company_row)
+                    company.pop('_trial_id', None)
                     company_id = company['company_id']
                     company_type = company.get('company_type', 'industry')
                     
@@ -1076,27 +1413,17 @@ class SQLiteService:
                             })
                 
                 # Industry sponsors are found through asset ownership, not direct trial links
-                lead_sponsor_ids = []
-                cursor.execute("""
-                    SELECT st.company_id
-                    FROM sponsors_trial st
-                    JOIN companies c ON c.company_id = st.company_id
-                    WHERE st.trial_id = ? AND st.role = 'lead_sponsor'
-                    AND COALESCE(c.company_type, 'industry') = 'industry'
-                """, (trial_id,))
-                for row in cursor.fetchall():
-                    lead_sponsor_ids.append(row['company_id'])
-                
-                # Get assets linked to this trial
-                cursor.execute("""
-                    SELECT a.*
-                    FROM assets a
-                    JOIN has_trial ht ON a.asset_id = ht.asset_id
-                    WHERE ht.trial_id = ?
-                """, (trial_id,))
-                
-                for asset_row in cursor.fetchall():
+                lead_sponsor_ids = [
+                    row['company_id']
+                    for row in sponsors_by_trial.get(trial_id, [])
+                    if row['role'] == 'lead_sponsor'
+                    and (row['company_type'] or 'industry') == 'industry'
+                ]
+
+                # Assets linked to this trial
+                for asset_row in assets_by_trial.get(trial_id, []):
                     asset = self._row_to_dict(asset_row)
+                    asset.pop('_trial_id', None)
                     asset_id = asset['asset_id']
                     
                     # Apply modality filter
@@ -1125,14 +1452,11 @@ class SQLiteService:
                                 "data": {}
                             })
                     
-                    # Get explicit owners for this asset so we don't add DEVELOPS for them (OWNS takes precedence)
-                    owner_ids_for_asset = set()
-                    cursor.execute("""
-                        SELECT company_id FROM owns WHERE asset_id = ?
-                    """, (asset_id,))
-                    for row in cursor.fetchall():
-                        owner_ids_for_asset.add(row['company_id'])
-                    
+                    # Explicit owners for this asset so we don't add DEVELOPS for them (OWNS takes precedence)
+                    owner_ids_for_asset = {
+                        row['company_id'] for row in owners_by_asset.get(asset_id, [])
+                    }
+
                     # Create DEVELOPS only from industry lead sponsor to asset; skip if company already OWNS (use OWNS in graph)
                     for sponsor_id in lead_sponsor_ids:
                         if sponsor_id in owner_ids_for_asset:
@@ -1152,16 +1476,10 @@ class SQLiteService:
                                 }
                             })
                     
-                    # Also get explicit ownership for this asset (may be different company)
-                    cursor.execute("""
-                        SELECT c.*, o.confidence, o.source
-                        FROM companies c
-                        JOIN owns o ON c.company_id = o.company_id
-                        WHERE o.asset_id = ?
-                    """, (asset_id,))
-                    
-                    for owner_row in cursor.fetchall():
+                    # Also add explicit ownership for this asset (may be different company)
+                    for owner_row in owners_by_asset.get(asset_id, []):
                         owner = self._row_to_dict(owner_row)
+                        owner.pop('_asset_id', None)
                         owner_id = owner['company_id']
                         
                         if owner_id not in seen_nodes:
@@ -1202,21 +1520,15 @@ class SQLiteService:
             "total_companies": 0
         }
         
-        # Same "all words in term" matching as get_indication_graph (conditions_searchable)
-        searchable_col = "LOWER(COALESCE(conditions_searchable, ''))"
-        searchable_col_t = "LOWER(COALESCE(t.conditions_searchable, ''))"
-        term_clauses = []
-        term_clauses_t = []
-        term_params: List[str] = []
-        for term in indication_terms:
-            words = [w for w in term.lower().split() if w]
-            if not words:
-                continue
-            term_clauses.append(" AND ".join([f"{searchable_col} LIKE ?" for _ in words]))
-            term_clauses_t.append(" AND ".join([f"{searchable_col_t} LIKE ?" for _ in words]))
-            term_params.extend([f"%{w}%" for w in words])
-        where_sql = " OR ".join([f"({c})" for c in term_clauses]) if term_clauses else "1=0"
-        where_sql_t = " OR ".join([f"({c})" for c in term_clauses_t]) if term_clauses_t else "1=0"
+        # Same "all words in term" matching as get_indication_graph
+        terms_key = tuple(indication_terms)
+        where_sql, like_params = _indication_where(
+            terms_key, "LOWER(COALESCE(conditions_searchable, ''))"
+        )
+        where_sql_t, _ = _indication_where(
+            terms_key, "LOWER(COALESCE(t.conditions_searchable, ''))"
+        )
+        term_params = list(like_params)
 
         with self.connection() as conn:
             cursor = conn.cursor()
@@ -1292,20 +1604,17 @@ class SQLiteService:
         with self.connection() as conn:
             cursor = conn.cursor()
             
-            cursor.execute("SELECT COUNT(*) FROM companies")
-            companies = cursor.fetchone()[0]
-            
-            cursor.execute("SELECT COUNT(*) FROM assets")
-            assets = cursor.fetchone()[0]
-            
-            cursor.execute("SELECT COUNT(*) FROM trials")
-            trials = cursor.fetchone()[0]
-            
-            cursor.execute("SELECT COUNT(*) FROM deals")
-            deals = cursor.fetchone()[0]
-            
-            cursor.execute("SELECT COUNT(*) FROM documents")
-            documents = cursor.fetchone()[0]
+            # One statement for all five counts: a single execute/fetchone
+            # round-trip instead of five
+            cursor.execute("""
+                SELECT
+                    (SELECT COUNT(*) FROM companies),
+                    (SELECT COUNT(*) FROM assets),
+                    (SELECT COUNT(*) FROM trials),
+                    (SELECT COUNT(*) FROM deals),
+                    (SELECT COUNT(*) FROM documents)
+            """)
+            companies, assets, trials, deals, documents = cursor.fetchone()
             
             return {
                 "companies": companies,
@@ -1335,8 +1644,13 @@ class SQLiteService:
         logger.info("Database cleared")
     
     def close(self):
-        """No-op for SQLite (connections are per-operation)."""
-        pass
+        """Close all pooled connections."""
+        while True:
+            try:
+                conn = self._pool.get_nowait()
+            except queue.Empty:
+                break
+            conn.close()
 
 
 # Singleton instance
@@ -0,0 +1,93 @@
+"""
+Tests for the in-process TTL response cache: expiry, invalidation, and the
+/admin/clear route actually dropping cached responses.
+"""
+import pytest
+from fastapi.testclient import TestClient
+
+from app.services import cache as cache_module
+from app.services.cache import TTLCache, get_response_cache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable monotonic clock so expiry tests don't sleep."""
+    now = [1000.0]
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+
+    def advance(seconds):
+        now[0] += seconds
+
+    return advance
+
+
+class TestTTLCache:
+    def test_set_get_roundtrip(self):
+        cache = TTLCache(default_ttl=60.0)
+        cache.set("key", {"value": 1})
+        assert cache.get("key") == {"value": 1}
+
+    def test_missing_key_returns_none(self):
+        cache = TTLCache(default_ttl=60.0)
+        assert cache.get("missing") is None
+
+    def test_entry_expires_after_default_ttl(self, clock):
+        cache = TTLCache(default_ttl=60.0)
+        cache.set("key", "value")
+        clock(59.0)
+        assert cache.get("key") == "value"
+        clock(2.0)
+        assert cache.get("key") is None
+
+    def test_per_entry_ttl_overrides_default(self, clock):
+        cache = TTLCache(default_ttl=3600.0)
+        cache.set("key", "value", ttl=10.0)
+        clock(11.0)
+        assert cache.get("key") is None
+
+    def test_pop_removes_single_entry(self):
+        cache = TTLCache(default_ttl=60.0)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.pop("a")
+        assert cache.get("a") is None
+        assert cache.get("b") == 2
+
+    def test_pop_missing_key_is_noop(self):
+        cache = TTLCache(default_ttl=60.0)
+        cache.pop("never-set")  # must not raise
+
+    def test_clear_drops_all_entries(self):
+        cache = TTLCache(default_ttl=60.0)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.clear()
+        assert cache.get("a") is None
+        assert cache.get("b") is None
+
+    def test_singleton_returns_same_instance(self):
+        assert get_response_cache() is get_response_cache()
+
+
+class TestAdminClearRoute:
+    def test_admin_clear_empties_response_cache(self, monkeypatch):
+        from app.main import app
+        from app.api import routes
+
+        class FakeNeo4j:
+            cleared = False
+
+            def clear_database(self):
+                self.cleared = True
+
+        fake = FakeNeo4j()
+        monkeypatch.setattr(routes, "get_neo4j_service", lambda: fake)
+
+        cache = get_response_cache()
+        cache.set(("landscape", "MuM"), ("etag", b"{}"))
+
+        client = TestClient(app)
+        response = client.post("/api/admin/clear")
+        assert response.status_code == 200
+        assert fake.cleared
+        assert cache.get(("landscape", "MuM")) is None
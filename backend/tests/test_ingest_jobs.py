@@ -0,0 +1,134 @@
+"""
+Tests for the background ingestion job registry and the /ingest background
+path: status transitions (queued/running/completed/failed) and the failure
+path recording its error.
+"""
+import pytest
+from fastapi.testclient import TestClient
+
+from app.services.ingest_jobs import IngestJobRegistry
+
+
+class TestIngestJobRegistry:
+    def test_create_returns_queued_job(self):
+        registry = IngestJobRegistry()
+        job_id = registry.create("MuM")
+        job = registry.get(job_id)
+        assert job["job_id"] == job_id
+        assert job["indication"] == "MuM"
+        assert job["status"] == "queued"
+        assert job["stats"] == {}
+        assert job["error"] is None
+        assert job["created_at"] is not None
+        assert job["finished_at"] is None
+
+    def test_mark_running_transitions_status(self):
+        registry = IngestJobRegistry()
+        job_id = registry.create("MuM")
+        registry.mark_running(job_id)
+        assert registry.get(job_id)["status"] == "running"
+
+    def test_mark_completed_records_stats_and_finish_time(self):
+        registry = IngestJobRegistry()
+        job_id = registry.create("MuM")
+        registry.mark_running(job_id)
+        registry.mark_completed(job_id, {"trials": 5})
+        job = registry.get(job_id)
+        assert job["status"] == "completed"
+        assert job["stats"] == {"trials": 5}
+        assert job["finished_at"] is not None
+        assert job["error"] is None
+
+    def test_mark_failed_records_error(self):
+        registry = IngestJobRegistry()
+        job_id = registry.create("MuM")
+        registry.mark_running(job_id)
+        registry.mark_failed(job_id, "upstream timeout")
+        job = registry.get(job_id)
+        assert job["status"] == "failed"
+        assert job["error"] == "upstream timeout"
+        assert job["finished_at"] is not None
+
+    def test_unknown_job_id_returns_none(self):
+        registry = IngestJobRegistry()
+        assert registry.get("no-such-job") is None
+
+    def test_marking_unknown_job_is_noop(self):
+        registry = IngestJobRegistry()
+        registry.mark_running("no-such-job")
+        registry.mark_completed("no-such-job", {})
+        registry.mark_failed("no-such-job", "err")  # must not raise
+
+    def test_get_returns_a_copy(self):
+        registry = IngestJobRegistry()
+        job_id = registry.create("MuM")
+        registry.get(job_id)["status"] = "tampered"
+        assert registry.get(job_id)["status"] == "queued"
+
+
+class _StubGraphService:
+    """GraphService stand-in so route tests never hit a database."""
+
+    def __init__(self, stats=None, error=None):
+        self._stats = stats if stats is not None else {}
+        self._error = error
+
+    def init_database(self):
+        pass
+
+    def ingest_indication(self, indication, max_trials=None):
+        if self._error is not None:
+            raise self._error
+        return self._stats
+
+
+class TestIngestRoute:
+    @pytest.fixture
+    def app(self):
+        from app.main import app
+        yield app
+        app.dependency_overrides.clear()
+
+    def test_background_ingest_completes(self, app):
+        from app.api.routes import graph_service_dep
+        stub = _StubGraphService(stats={"trials": 3, "companies": 2})
+        app.dependency_overrides[graph_service_dep] = lambda: stub
+
+        client = TestClient(app)
+        response = client.post(
+            "/api/ingest/clinicaltrials",
+            json={"indication": "MuM", "background": True}
+        )
+        assert response.status_code == 200
+        body = response.json()
+        assert body["status"] == "queued"
+        assert body["job_id"]
+
+        # TestClient runs background tasks before returning, so the job
+        # has already gone queued -> running -> completed
+        status = client.get(f"/api/ingest/status/{body['job_id']}")
+        assert status.status_code == 200
+        job = status.json()
+        assert job["status"] == "completed"
+        assert job["stats"] == {"trials": 3, "companies": 2}
+
+    def test_background_ingest_failure_records_error(self, app):
+        from app.api.routes import graph_service_dep
+        stub = _StubGraphService(error=RuntimeError("CT.gov unreachable"))
+        app.dependency_overrides[graph_service_dep] = lambda: stub
+
+        client = TestClient(app)
+        response = client.post(
+            "/api/ingest/clinicaltrials",
+            json={"indication": "MuM", "background": True}
+        )
+        assert response.status_code == 200
+        job_id = response.json()["job_id"]
+
+        job = client.get(f"/api/ingest/status/{job_id}").json()
+        assert job["status"] == "failed"
+        assert "CT.gov unreachable" in job["error"]
+
+    def test_unknown_job_status_is_404(self, app):
+        client = TestClient(app)
+        assert client.get("/api/ingest/status/no-such-job").status_code == 404